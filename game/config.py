@@ -11,7 +11,8 @@ without touching game logic.
 
 # Which eras are considered "European/Western" vs global
 # European focus includes Western culture (Americas colonized by Europeans)
-EUROPEAN_ERA_IDS = [
+# frozenset: only ever used for "era_id in EUROPEAN_ERA_IDS" filtering
+EUROPEAN_ERA_IDS = frozenset([
     "classical_athens",      # Greece
     "viking_age",            # Scandinavia
     "medieval_plague",       # Europe
@@ -21,7 +22,7 @@ EUROPEAN_ERA_IDS = [
     "ww2_europe",            # Europe
     "ww2_pacific",           # American Home Front (Western culture)
     "cold_war_germany",      # Cold War East Germany
-]
+])
 
 # All other eras are "worldwide/global"
 # ancient_egypt, han_dynasty, aztec_empire, mughal_india, indian_partition
@@ -192,6 +193,21 @@ MODES = {
     }
 }
 
+# =============================================================================
+# NARRATOR CONTEXT
+# =============================================================================
+
+# Model for the narration and for history summaries, so they never drift apart
+NARRATOR_MODEL = "claude-sonnet-4-20250514"
+
+# Conversation rounds (player prompt + narration) sent to the AI verbatim
+WINDOW_ROUNDS = 6
+
+# Once this many rounds have aged out of the window, fold them into the
+# running summary in one call. Batching keeps the cached prompt prefix
+# stable between folds.
+SUMMARY_EVERY = 4
+
 # =============================================================================
 # DISPLAY SETTINGS
 # =============================================================================
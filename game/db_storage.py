@@ -6,6 +6,9 @@ Storage adapters that call the Express API for persistence instead of JSON files
 
 import os
 import json
+import atexit
+import queue
+import threading
 import requests
 from typing import List, Dict, Optional
 from datetime import datetime
@@ -15,41 +18,119 @@ API_BASE_URL = os.environ.get("API_BASE_URL", "http://localhost:5000")
 
 
 class DatabaseSaveManager:
-    """Manages saving and loading game states via Express API"""
+    """
+    Manages saving and loading game states via Express API.
+    Saves are posted on a background thread so a turn never waits on the
+    network; reads and deletes of a game first wait for its queued save.
+    """
     
     def __init__(self, api_base: str = None):
         self.api_base = api_base or API_BASE_URL
+        
+        # Background writer: slot (user_id, game_id) -> newest request body
+        # not yet posted. A slot is queued once however often it is saved.
+        self._write_q: queue.Queue = queue.Queue()
+        self._pending: Dict[tuple, str] = {}
+        self._in_flight: set = set()
+        self._pending_done = threading.Condition()
+        self._save_errors: Dict[tuple, Exception] = {}
+        self._writer: Optional[threading.Thread] = None  # Started by the first save
     
     def save_game(self, user_id: str, game_id: str, state) -> bool:
         """
-        Save game state to database via API.
-        Returns True if successful.
+        Queue a save of the game state to the database.
+        Returns True once queued; a failed post is reported by save_error().
         """
         try:
             save_data = state.to_save_dict()
-            
-            response = requests.post(
-                f"{self.api_base}/api/saves",
-                json={
-                    "userId": user_id,
-                    "gameId": game_id,
-                    "playerName": save_data.get("player_name"),
-                    "currentEra": state.current_era.era_name if state.current_era else None,
-                    "phase": save_data.get("phase"),
-                    "state": save_data,
-                },
-                timeout=10
-            )
-            return response.status_code == 200
+            # Serialize now: save_data shares lists with the live state
+            body = json.dumps({
+                "userId": user_id,
+                "gameId": game_id,
+                "playerName": save_data.get("player_name"),
+                "currentEra": state.current_era.era_name if state.current_era else None,
+                "phase": save_data.get("phase"),
+                "state": save_data,
+            })
         except Exception as e:
             print(f"Database save error: {e}")
             return False
+        
+        slot = (user_id, game_id)
+        with self._pending_done:
+            queued = slot in self._pending
+            self._pending[slot] = body
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+                self._writer.start()
+                atexit.register(self.flush)
+        if not queued:
+            self._write_q.put(slot)
+        return True
+    
+    def flush(self, user_id: str = None, game_id: str = None):
+        """
+        Block until queued saves are posted - every save, or only those of
+        one user, or of one game.
+        """
+        if user_id is None:
+            self._write_q.join()
+            return
+        
+        def waiting(slot):
+            return slot[0] == user_id and game_id in (None, slot[1])
+        
+        with self._pending_done:
+            self._pending_done.wait_for(
+                lambda: not any(map(waiting, self._pending.keys() | self._in_flight))
+            )
+    
+    def save_error(self, user_id: str, game_id: str) -> Optional[Exception]:
+        """Why the last background save of a game failed, or None"""
+        return self._save_errors.get((user_id, game_id))
+    
+    def _writer_loop(self):
+        """Background thread: post the newest body of each queued game"""
+        while True:
+            slot = self._write_q.get()
+            with self._pending_done:
+                body = self._pending.get(slot)
+                if body is not None:  # None: deleted while queued
+                    self._in_flight.add(slot)
+            if body is not None:
+                try:
+                    self._post_save(body)
+                    self._save_errors.pop(slot, None)
+                except Exception as e:
+                    self._save_errors[slot] = e
+                    print(f"Database save error: {e}")
+                with self._pending_done:
+                    self._in_flight.discard(slot)
+                    # A newer save arrived during the post - go again
+                    if self._pending.get(slot) is body:
+                        del self._pending[slot]
+                    elif slot in self._pending:
+                        self._write_q.put(slot)
+                    self._pending_done.notify_all()
+            self._write_q.task_done()
+    
+    def _post_save(self, body: str):
+        """Send one serialized save to the API"""
+        response = requests.post(
+            f"{self.api_base}/api/saves",
+            data=body,
+            headers={"Content-Type": "application/json"},
+            timeout=10
+        )
+        if response.status_code != 200:
+            raise IOError(f"save rejected with status {response.status_code}")
     
     def load_game(self, user_id: str, game_id: str):
         """
         Load game state from database via API.
         Returns GameState or None if not found.
         """
+        self.flush(user_id, game_id)  # Read back our own latest save
         try:
             response = requests.get(
                 f"{self.api_base}/api/saves/{user_id}/{game_id}",
@@ -71,6 +152,12 @@ class DatabaseSaveManager:
     
     def delete_game(self, user_id: str, game_id: str) -> bool:
         """Delete a saved game"""
+        # Drop a queued save and wait out one being posted, so neither can
+        # bring the game back after the delete
+        with self._pending_done:
+            self._pending.pop((user_id, game_id), None)
+        self.flush(user_id, game_id)
+        self._save_errors.pop((user_id, game_id), None)
         try:
             response = requests.delete(
                 f"{self.api_base}/api/saves/{user_id}/{game_id}",
@@ -82,6 +169,7 @@ class DatabaseSaveManager:
     
     def list_user_games(self, user_id: str) -> List[Dict]:
         """List all saved games for a user"""
+        self.flush(user_id)
         try:
             response = requests.get(
                 f"{self.api_base}/api/saves/{user_id}",
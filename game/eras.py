@@ -2056,12 +2056,13 @@ aesthetic - no modern vehicles.""",
 ]
 
 
+# Era lookup by ID, built once at import
+ERAS_BY_ID = {era['id']: era for era in ERAS}
+
+
 def get_era_by_id(era_id):
     """Get a specific era by ID"""
-    for era in ERAS:
-        if era['id'] == era_id:
-            return era
-    return None
+    return ERAS_BY_ID.get(era_id)
 
 
 def get_random_era():
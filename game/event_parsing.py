@@ -56,17 +56,24 @@ These tags are hidden from the player.
 """
 
 
+# Tag patterns, compiled once - every response is scanned for each of them
+_CHARACTER_NAME_RE = re.compile(r'<character_name>\s*([^<]+?)\s*</character_name>', re.IGNORECASE)
+_KEY_NPC_RE = re.compile(r'<key_npc>\s*([^<]+?)\s*</key_npc>', re.IGNORECASE)
+_WISDOM_RE = re.compile(r'<wisdom>\s*([^<]+?)\s*</wisdom>', re.IGNORECASE)
+_EVENT_TAG_STRIP_RES = tuple(
+    re.compile(rf'<{tag}>\s*[^<]*?\s*</{tag}>', re.IGNORECASE)
+    for tag in ("character_name", "key_npc", "wisdom")
+)
+_BLANK_RUN_RE = re.compile(r'\n\s*\n\s*\n')
+
+
 def parse_character_name(response: str) -> Optional[str]:
     """
     Extract the character name given to the player in this era.
     
     Returns the name if found, None otherwise.
     """
-    match = re.search(
-        r'<character_name>\s*([^<]+?)\s*</character_name>',
-        response,
-        re.IGNORECASE
-    )
+    match = _CHARACTER_NAME_RE.search(response)
     if match:
         return match.group(1).strip()
     return None
@@ -78,11 +85,7 @@ def parse_key_npcs(response: str) -> List[str]:
     
     Returns a list of NPC names (may contain duplicates if mentioned multiple times).
     """
-    matches = re.findall(
-        r'<key_npc>\s*([^<]+?)\s*</key_npc>',
-        response,
-        re.IGNORECASE
-    )
+    matches = _KEY_NPC_RE.findall(response)
     return [name.strip() for name in matches if name.strip()]
 
 
@@ -92,11 +95,7 @@ def parse_wisdom_moment(response: str) -> Optional[str]:
     
     Returns the wisdom ID if found, None otherwise.
     """
-    match = re.search(
-        r'<wisdom>\s*([^<]+?)\s*</wisdom>',
-        response,
-        re.IGNORECASE
-    )
+    match = _WISDOM_RE.search(response)
     if match:
         return match.group(1).strip()
     return None
@@ -109,32 +108,13 @@ def strip_event_tags(response: str) -> str:
     Removes: <character_name>, <key_npc>, <wisdom> tags
     Note: Anchor tags are handled separately by strip_anchor_tags()
     """
-    # Remove character_name tags
-    response = re.sub(
-        r'<character_name>\s*[^<]*?\s*</character_name>',
-        '',
-        response,
-        flags=re.IGNORECASE
-    )
-    
-    # Remove key_npc tags
-    response = re.sub(
-        r'<key_npc>\s*[^<]*?\s*</key_npc>',
-        '',
-        response,
-        flags=re.IGNORECASE
-    )
-    
-    # Remove wisdom tags
-    response = re.sub(
-        r'<wisdom>\s*[^<]*?\s*</wisdom>',
-        '',
-        response,
-        flags=re.IGNORECASE
-    )
+    # No '<' means no tag - skip the tag scans
+    if '<' in response:
+        for tag_re in _EVENT_TAG_STRIP_RES:
+            response = tag_re.sub('', response)
     
     # Clean up any extra whitespace left behind
-    response = re.sub(r'\n\s*\n\s*\n', '\n\n', response)
+    response = _BLANK_RUN_RE.sub('\n\n', response)
     
     return response.strip()
 
@@ -22,8 +22,10 @@ import os
 import re
 import textwrap
 import threading
+import queue
 import sys
-from typing import List
+from typing import Callable, List, Optional
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
 
@@ -36,7 +38,10 @@ except ImportError:
     print("Note: anthropic package not installed. Running in demo mode.")
 
 # Local imports
-from config import TEXT_SPEED, SHOW_DEVICE_STATUS, MODES, EUROPEAN_ERA_IDS, get_debug_era_id
+from config import (
+    TEXT_SPEED, SHOW_DEVICE_STATUS, MODES, EUROPEAN_ERA_IDS, get_debug_era_id,
+    NARRATOR_MODEL
+)
 from game_state import GameState, GameMode, GamePhase, RegionPreference
 from time_machine import TimeMachine, select_random_era, IndicatorState
 from fulfillment import parse_anchor_adjustments, strip_anchor_tags
@@ -48,6 +53,13 @@ from prompts import (
     get_historian_narrative_prompt
 )
 from scoring import Score, Leaderboard, calculate_score, GameHistory, AoAEntry, AnnalsOfAnachron
+from response_cache import ResponseCache
+from history_summary import HistorySummarizer, cached_request
+
+
+# Era pools by region, built once - ERAS never changes at runtime
+_ALL_ERAS = tuple(ERAS)
+_EUROPEAN_ERAS = tuple(e for e in ERAS if e['id'] in EUROPEAN_ERA_IDS)
 
 
 # =============================================================================
@@ -67,39 +79,53 @@ class Colors:
     END = '\033[0m'
 
 
+# No escape codes when piped/logged or when the user opts out (no-color.org).
+# Decided once here, so every f-string below just interpolates "".
+if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+    for _name in ("HEADER", "BLUE", "CYAN", "GREEN", "YELLOW", "RED", "BOLD", "DIM", "END"):
+        setattr(Colors, _name, "")
+    del _name
+
+
 class Spinner:
-    """Loading spinner"""
+    """Loading spinner, advanced by the caller while it waits"""
     
     def __init__(self, message="Thinking"):
         self.message = message
-        self.spinning = False
-        self.thread = None
         self.frames = ['Ã¢â‚¬â€', '\\', '|', '/']
-        
-    def _spin(self):
-        idx = 0
-        while self.spinning:
-            frame = self.frames[idx % len(self.frames)]
-            print(f"\r{Colors.DIM}{self.message}... {frame}{Colors.END}", end='', flush=True)
-            idx += 1
-            time.sleep(0.1)
-        print(f"\r{' ' * (len(self.message) + 10)}\r", end='', flush=True)
-        
-    def start(self):
-        self.spinning = True
-        self.thread = threading.Thread(target=self._spin)
-        self.thread.start()
-        
-    def stop(self):
-        self.spinning = False
-        if self.thread:
-            self.thread.join()
+        self.idx = 0
+        self.shown = False
+        
+    def tick(self):
+        """Draw the next frame over the previous one"""
+        frame = self.frames[self.idx % len(self.frames)]
+        sys.stdout.write(f"\r{Colors.DIM}{self.message}... {frame}{Colors.END}")
+        sys.stdout.flush()
+        self.idx += 1
+        self.shown = True
+        
+    def clear(self):
+        """Erase the spinner line if it was drawn"""
+        if self.shown:
+            sys.stdout.write(f"\r{' ' * (len(self.message) + 10)}\r")
+            sys.stdout.flush()
+            self.shown = False
+
+
+# Seconds without a streamed chunk before the spinner advances a frame
+SPINNER_INTERVAL = 0.1
 
 
 def clear_screen():
     os.system('cls' if os.name == 'nt' else 'clear')
 
 
+@lru_cache(maxsize=512)
+def _wrap_cached(line, width):
+    """Wrap a line for print_box; panels redraw the same text every turn"""
+    return tuple(textwrap.wrap(line, width=width) or ('',))
+
+
 def print_box(lines, color=Colors.CYAN, width=70):
     """Print text in a box"""
     content_width = width - 2
@@ -109,8 +135,7 @@ def print_box(lines, color=Colors.CYAN, width=70):
             if len(subline.strip()) == 0:
                 print(f"{color}Ã¢â€¢â€˜{Colors.END} {' ' * content_width} {color}Ã¢â€¢â€˜{Colors.END}")
             else:
-                wrapped = textwrap.wrap(subline, width=content_width) or ['']
-                for wrapped_line in wrapped:
+                for wrapped_line in _wrap_cached(subline, content_width):
                     padded = wrapped_line.ljust(content_width)
                     print(f"{color}Ã¢â€¢â€˜{Colors.END} {padded} {color}Ã¢â€¢â€˜{Colors.END}")
     print(f"{color}Ã¢â€¢Å¡{'Ã¢â€¢Â' * width}Ã¢â€¢Â{Colors.END}")
@@ -123,38 +148,193 @@ def print_header(text, color=Colors.HEADER):
     print(f"{'Ã¢â€¢Â' * 70}{Colors.END}\n")
 
 
+# The unit the typewriter effect writes: at least 12 characters, extended to
+# the end of the word and its trailing whitespace (or the rest of the text)
+_TYPE_CHUNK_RE = re.compile(r'.{12,}?(?:\s+|\Z)|.+', re.DOTALL)
+
+
+def type_out(text, delay):
+    """Write text a few words at a time, pausing as long as per-character output would"""
+    if delay <= 0:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+    for chunk in _TYPE_CHUNK_RE.findall(text):
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+        time.sleep(delay * len(chunk))
+
+
 def slow_print(text, delay=TEXT_SPEED):
     """Typewriter effect"""
-    for char in text:
-        print(char, end='', flush=True)
-        time.sleep(delay)
+    type_out(text, delay)
     print()
 
 
 def get_input(prompt, valid_options=None):
     """Get validated input"""
+    # Build both strings once rather than on every retry
+    styled_prompt = f"{Colors.YELLOW}{prompt}{Colors.END} "
+    retry_message = None
+    if valid_options is not None:
+        retry_message = f"{Colors.RED}Please enter one of: {', '.join(valid_options)}{Colors.END}"
     while True:
-        response = input(f"{Colors.YELLOW}{prompt}{Colors.END} ").strip().upper()
+        response = input(styled_prompt).strip().upper()
         if valid_options is None or response in valid_options:
             return response
-        print(f"{Colors.RED}Please enter one of: {', '.join(valid_options)}{Colors.END}")
+        print(retry_message)
 
 
 def roll_dice(sides=20, show=True):
     """Roll a die with optional animation"""
+    roll = random.randint(1, sides)
     if show:
-        print(f"{Colors.DIM}Rolling...{Colors.END}", end=' ')
-        for _ in range(5):
-            print(f"{random.randint(1, sides)}", end=' ', flush=True)
-            time.sleep(0.1)
-        print()
-    return random.randint(1, sides)
+        show_roll(roll, sides)
+    return roll
+
+
+def show_roll(roll, sides=20):
+    """Animate a die landing on an already-decided roll"""
+    if TEXT_SPEED == 0:
+        return
+    
+    # Tumble through a few faces on one line, then land on the roll
+    frames = [random.randint(1, sides) for _ in range(5)]
+    for value in frames:
+        sys.stdout.write(f"\r{Colors.DIM}Rolling... {value:>2}{Colors.END}")
+        sys.stdout.flush()
+        time.sleep(0.1)
+    print(f"\r{Colors.DIM}Rolling... {roll:>2}{Colors.END}")
 
 
 # =============================================================================
 # AI INTEGRATION
 # =============================================================================
 
+class AnchorStreamFilter:
+    """
+    Hides <anchors>...</anchors> from streamed text in a single pass.
+
+    Each character is looked at once, so filtering is O(n) over the response.
+    Only the few characters that could still be the start of a tag are held
+    back; everything else is written out as soon as its chunk arrives.
+    """
+
+    OPEN_TAG = "<anchors>"
+    CLOSE_TAG = "</anchors>"
+
+    # States
+    TEXT = 0          # Plain narrative, printed straight through
+    MAYBE_OPEN = 1    # Matched a prefix of OPEN_TAG, holding it back
+    INSIDE = 2        # Inside the tag, discarding
+    MAYBE_CLOSE = 3   # Matched a prefix of CLOSE_TAG
+
+    def __init__(self, out=None):
+        self.out = out or sys.stdout
+        self.state = self.TEXT
+        self.match_pos = 0
+        self._fd = self._raw_fd() if out is None else None
+
+    @staticmethod
+    def _raw_fd():
+        """
+        File descriptor for writing to stdout directly, or None.
+
+        Skipping the text wrapper saves a lock and a flush per chunk. Not used
+        on Windows, where the console layer is what renders ANSI colors.
+        """
+        if os.name == 'nt':
+            return None
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, ValueError, OSError):
+            return None
+        # Anything already buffered must land before our raw writes
+        sys.stdout.flush()
+        return fd
+
+    def _write(self, text: str):
+        if self._fd is None:
+            self.out.write(text)
+            self.out.flush()
+            return
+        data = text.encode(sys.stdout.encoding or 'utf-8', 'replace')
+        while data:
+            data = data[os.write(self._fd, data):]
+
+    def feed(self, text: str):
+        """Filter one streamed chunk and write the visible part"""
+        visible = []
+        for char in text:
+            self._step(char, visible)
+        if visible:
+            self._write(''.join(visible))
+
+    def flush(self):
+        """End of stream - release a held-back partial opening tag"""
+        if self.state == self.MAYBE_OPEN:
+            self._write(self.OPEN_TAG[:self.match_pos])
+        self.state = self.TEXT
+        self.match_pos = 0
+
+    def _step(self, char: str, visible: list):
+        """Advance the state machine by one character"""
+        if self.state in (self.TEXT, self.MAYBE_OPEN):
+            if char == self.OPEN_TAG[self.match_pos]:
+                self.match_pos += 1
+                self.state = self.MAYBE_OPEN
+                if self.match_pos == len(self.OPEN_TAG):
+                    self.state = self.INSIDE
+                    self.match_pos = 0
+            elif self.match_pos:
+                # Partial match failed - release it and re-check this char,
+                # since it may itself start a new tag (e.g. "<<anchors>")
+                visible.append(self.OPEN_TAG[:self.match_pos])
+                self.state = self.TEXT
+                self.match_pos = 0
+                self._step(char, visible)
+            else:
+                visible.append(char)
+        else:
+            if char == self.CLOSE_TAG[self.match_pos]:
+                self.match_pos += 1
+                self.state = self.MAYBE_CLOSE
+                if self.match_pos == len(self.CLOSE_TAG):
+                    self.state = self.TEXT
+                    self.match_pos = 0
+            else:
+                self.match_pos = 1 if char == self.CLOSE_TAG[0] else 0
+                self.state = self.MAYBE_CLOSE if self.match_pos else self.INSIDE
+
+
+# Canned narration for demo mode (no API key or anthropic not installed)
+_DEMO_ARRIVAL = """You stumble forward, catching yourself against rough stone. The air hits you firstÃ¢â‚¬â€woodsmoke, animal dung, something cooking. Your ears ring from the transition.
+
+When your vision clears, you see a narrow street of packed earth. Wooden buildings lean against each other, their upper floors jutting out. People in rough wool and leather stop to stare at your strange clothing.
+
+A woman carrying a basket of bread crosses herself and hurries past. A dog barks. Somewhere nearby, a hammer rings against metal.
+
+You are Thomas the Stranger nowÃ¢â‚¬â€that's what they'll call you. Your device hangs cool against your chest, dormant. Your three items are hidden beneath your coat. You need shelter before dark, and you need to figure out when and where you are.
+
+A tavern sign creaks in the wind ahead. To your left, a church bell tower rises above the rooftops. To your right, a blacksmith's forge glows orange through an open door.
+
+[A] Head to the tavern - travelers gather there, and you need information
+[B] Make for the church - sanctuary and perhaps a sympathetic ear
+[C] Approach the blacksmith - honest work might earn trust faster than questions
+
+<anchors>belonging[0] legacy[0] freedom[0]</anchors>"""
+
+_DEMO_TURN = """Your choice sets events in motion. The day unfolds with unexpected consequences.
+
+People are beginning to know your face now. Some nod in recognition. Others still eye you with suspicion. This place is becoming familiar, for better or worse.
+
+[A] Press forward with your current path
+[B] Seek out someone you've met before
+[C] Take time to observe and plan
+
+<anchors>belonging[+3] legacy[+1] freedom[+2]</anchors>"""
+
+
 class NarrativeEngine:
     """Handles AI-generated narrative"""
     
@@ -167,125 +347,140 @@ class NarrativeEngine:
             self.client = anthropic.Anthropic()
         else:
             self.client = None
+        self.cache = ResponseCache.from_env()  # Opt-in replay cache, shared process-wide
+        self.history = HistorySummarizer(self.client)  # Rolling summary of aged-out rounds
     
     def set_era(self, era: dict):
         """Set up system prompt for current era"""
         self.system_prompt = get_system_prompt(self.game_state, era)
         self.messages = []  # Fresh conversation for new era
     
-    def generate(self, user_prompt: str, stream: bool = True) -> str:
-        """Generate narrative response"""
+    def generate(self, user_prompt: str, stream: bool = True,
+                 while_waiting: Optional[Callable[[], None]] = None) -> str:
+        """
+        Generate narrative response.
+        while_waiting, if given, runs once the request is in flight - screen
+        output placed there overlaps the wait for the first token.
+        """
+        self.history.apply(self.messages)  # Fold in a finished summary, if any
         self.messages.append({"role": "user", "content": user_prompt})
         
         if not self.client:
             response = self._demo_response(user_prompt)
+            if while_waiting:
+                while_waiting()
             if stream:
-                for char in response:
-                    print(char, end='', flush=True)
-                    time.sleep(0.008)
+                type_out(response, 0.008)
                 print()
         else:
-            response = self._api_call(stream)
+            response = self._api_call(stream, while_waiting)
         
         self.messages.append({"role": "assistant", "content": response})
+        self.history.schedule(self.messages)
         return response
     
-    def _api_call(self, stream: bool) -> str:
+    def _api_call(self, stream: bool, while_waiting: Optional[Callable[[], None]] = None) -> str:
         """Make API call with streaming"""
+        cache_key = None
+        if self.cache:
+            cache_key = ResponseCache.key(self.system_prompt, self.messages)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if while_waiting:
+                    while_waiting()
+                if stream:
+                    anchor_filter = AnchorStreamFilter()
+                    anchor_filter.feed(cached)
+                    anchor_filter.flush()
+                    print()
+                return cached
+        
         spinner = Spinner("Generating")
-        spinner.start()
         
-        response = ""
+        parts = []
         first_token = True
-        buffer = ""  # Buffer to detect and hide anchor tags
-        in_anchor_tag = False
+        
+        # The SDK stream blocks, so it runs on a reader thread; this thread
+        # ticks the spinner whenever nothing arrives for SPINNER_INTERVAL
+        chunks = queue.Queue()
+        reader = threading.Thread(target=self._read_stream, args=(chunks,), daemon=True)
         
         try:
-            with self.client.messages.stream(
-                model="claude-sonnet-4-20250514",
-                max_tokens=1500,
-                system=self.system_prompt,
-                messages=self.messages
-            ) as api_stream:
-                for text in api_stream.text_stream:
-                    if first_token:
-                        spinner.stop()
-                        first_token = False
-                    response += text
-                    
-                    if stream:
-                        buffer += text
-                        
-                        # Check for anchor tag start
-                        if '<anchors>' in buffer:
-                            # Print everything before the tag
-                            before_tag = buffer.split('<anchors>')[0]
-                            print(before_tag, end='', flush=True)
-                            buffer = '<anchors>' + buffer.split('<anchors>', 1)[1]
-                            in_anchor_tag = True
-                        
-                        # Check for anchor tag end
-                        if in_anchor_tag and '</anchors>' in buffer:
-                            # Discard the tag, keep anything after
-                            after_tag = buffer.split('</anchors>', 1)[1] if '</anchors>' in buffer else ''
-                            buffer = after_tag
-                            in_anchor_tag = False
-                        
-                        # If not in tag and no partial tag detected, print buffer
-                        if not in_anchor_tag and '<' not in buffer:
-                            print(buffer, end='', flush=True)
-                            buffer = ""
-                        elif not in_anchor_tag and '<' in buffer and '>' in buffer:
-                            # Complete non-anchor tag, just print it
-                            if '<anchors>' not in buffer:
-                                print(buffer, end='', flush=True)
-                                buffer = ""
-            
-            # Print any remaining buffer (excluding anchor content)
-            if stream and buffer and not in_anchor_tag:
-                clean_buffer = re.sub(r'<anchors>.*?</anchors>', '', buffer, flags=re.DOTALL)
-                print(clean_buffer, end='', flush=True)
+            reader.start()
+            if while_waiting:
+                while_waiting()
+            # Created after any intro output - it flushes stdout before raw writes
+            anchor_filter = AnchorStreamFilter()  # Hides anchor tags as they stream
+            while True:
+                if first_token:
+                    try:
+                        text = chunks.get(timeout=SPINNER_INTERVAL)
+                    except queue.Empty:
+                        spinner.tick()
+                        continue
+                    spinner.clear()
+                    first_token = False
+                else:
+                    text = chunks.get()
+                
+                if text is None:
+                    break
+                if isinstance(text, Exception):
+                    raise text
+                
+                parts.append(text)
+                if stream:
+                    anchor_filter.feed(text)
             
             if stream:
+                # Release any held-back partial tag
+                anchor_filter.flush()
                 print()
-            if first_token:
-                spinner.stop()
+            
+            response = "".join(parts)
+            if cache_key:
+                self.cache.put(cache_key, response)
                 
         except Exception as e:
-            spinner.stop()
+            spinner.clear()
             print(f"{Colors.RED}AI Error: {e}{Colors.END}")
             response = self._demo_response("")
             
         return response
     
+    def _read_stream(self, chunks: queue.Queue):
+        """
+        Reader thread for _api_call: put each streamed text chunk on the
+        queue, then any error raised, then None to mark the end.
+        """
+        try:
+            system, messages = cached_request(self.system_prompt, self.messages)
+            with self.client.messages.stream(
+                model=NARRATOR_MODEL,
+                max_tokens=1500,
+                system=system,
+                messages=messages
+            ) as api_stream:
+                for text in api_stream.text_stream:
+                    chunks.put(text)
+        except Exception as e:
+            chunks.put(e)
+        finally:
+            chunks.put(None)
+    
     def _demo_response(self, prompt: str) -> str:
         """Demo response when API unavailable"""
-        if "arrival" in prompt.lower() or len(self.messages) <= 2:
-            return """You stumble forward, catching yourself against rough stone. The air hits you firstÃ¢â‚¬â€woodsmoke, animal dung, something cooking. Your ears ring from the transition.
-
-When your vision clears, you see a narrow street of packed earth. Wooden buildings lean against each other, their upper floors jutting out. People in rough wool and leather stop to stare at your strange clothing.
-
-A woman carrying a basket of bread crosses herself and hurries past. A dog barks. Somewhere nearby, a hammer rings against metal.
-
-You are Thomas the Stranger nowÃ¢â‚¬â€that's what they'll call you. Your device hangs cool against your chest, dormant. Your three items are hidden beneath your coat. You need shelter before dark, and you need to figure out when and where you are.
-
-A tavern sign creaks in the wind ahead. To your left, a church bell tower rises above the rooftops. To your right, a blacksmith's forge glows orange through an open door.
-
-[A] Head to the tavern - travelers gather there, and you need information
-[B] Make for the church - sanctuary and perhaps a sympathetic ear
-[C] Approach the blacksmith - honest work might earn trust faster than questions
-
-<anchors>belonging[0] legacy[0] freedom[0]</anchors>"""
-        else:
-            return """Your choice sets events in motion. The day unfolds with unexpected consequences.
-
-People are beginning to know your face now. Some nod in recognition. Others still eye you with suspicion. This place is becoming familiar, for better or worse.
+        if len(self.messages) <= 2 or "arrival" in prompt.lower():
+            return _DEMO_ARRIVAL
+        return _DEMO_TURN
 
-[A] Press forward with your current path
-[B] Seek out someone you've met before
-[C] Take time to observe and plan
 
-<anchors>belonging[+3] legacy[+1] freedom[+2]</anchors>"""
+# Choice lines ("[A] Do something") and trailing artifacts to trim from them.
+# Multiline, so one finditer over the response finds every choice line;
+# group 2 is the text with surrounding whitespace already excluded.
+_CHOICE_RE = re.compile(r'^[^\S\n]*\[([A-C])\][^\S\n]*([^\n]*\S)', re.IGNORECASE | re.MULTILINE)
+_TAG_TAIL_RE = re.compile(r'\s*<[^>]+>.*$')
+_SCORES_RE = re.compile(r'\s*SCORES:.*$', re.IGNORECASE)
 
 
 # =============================================================================
@@ -295,6 +490,14 @@ People are beginning to know your face now. Some nod in recognition. Others stil
 class Game:
     """Main game controller"""
     
+    # Device indicator line, one per IndicatorState
+    _DEVICE_STATUS = {
+        IndicatorState.DARK: f"\n{Colors.DIM}[Device: silent]{Colors.END}",
+        IndicatorState.FAINT_PULSE: f"\n{Colors.DIM}[Device: faint pulse]{Colors.END}",
+        IndicatorState.STEADY_GLOW: f"\n{Colors.YELLOW}[Device: glowing steadily]{Colors.END}",
+        IndicatorState.BRIGHT_PULSE: f"\n{Colors.GREEN}[Device: WINDOW OPEN]{Colors.END}",
+    }
+    
     def __init__(self):
         self.state = GameState()
         self.narrator = None
@@ -396,10 +599,11 @@ class Game:
         slow_print("All you have is what was in your pockets:")
         print()
         
+        # Item list in one write
+        lines = []
         for item in self.state.inventory.modern_items:
-            print(f"  {Colors.GREEN}Ã¢â‚¬Â¢ {item.name}{Colors.END}")
-            print(f"    {Colors.DIM}{item.description}{Colors.END}")
-            print()
+            lines += [f"  {Colors.GREEN}Ã¢â‚¬Â¢ {item.name}{Colors.END}", f"    {Colors.DIM}{item.description}{Colors.END}", ""]
+        print('\n'.join(lines))
         
         input(f"\n{Colors.DIM}Press Enter to learn about the device...{Colors.END}")
         
@@ -415,21 +619,22 @@ class Game:
         slow_print("You wear it on your wrist, hidden under your sleeve.")
         time.sleep(0.5)
         
-        print(f"\n{Colors.CYAN}HOW IT WORKS:{Colors.END}\n")
-        print(f"  {Colors.YELLOW}Ã¢â‚¬Â¢{Colors.END} The window to use it won't open immediately when you arrive")
-        print(f"  {Colors.YELLOW}Ã¢â‚¬Â¢{Colors.END} You'll have time to settle in firstÃ¢â‚¬â€typically most of a year")
-        print(f"  {Colors.YELLOW}Ã¢â‚¬Â¢{Colors.END} When the window opens, you have a short time to decide")
-        print(f"  {Colors.YELLOW}Ã¢â‚¬Â¢{Colors.END} Choose to activate it, or let the window close and stay")
-        print()
-        
-        print(f"{Colors.CYAN}THE CATCH:{Colors.END}\n")
-        print(f"  {Colors.YELLOW}Ã¢â‚¬Â¢{Colors.END} You can't choose when you goÃ¢â‚¬â€it's random")
-        print(f"  {Colors.YELLOW}Ã¢â‚¬Â¢{Colors.END} Your three items always come with you")
-        print(f"  {Colors.YELLOW}Ã¢â‚¬Â¢{Colors.END} Your relationships do NOT come with you")
-        print(f"  {Colors.YELLOW}Ã¢â‚¬Â¢{Colors.END} Each jump means starting over")
-        print()
-        
-        print(f"{Colors.CYAN}THE GOAL:{Colors.END}\n")
+        # Static rules: one write instead of a print per line
+        print('\n'.join([
+            f"\n{Colors.CYAN}HOW IT WORKS:{Colors.END}\n",
+            f"  {Colors.YELLOW}Ã¢â‚¬Â¢{Colors.END} The window to use it won't open immediately when you arrive",
+            f"  {Colors.YELLOW}Ã¢â‚¬Â¢{Colors.END} You'll have time to settle in firstÃ¢â‚¬â€typically most of a year",
+            f"  {Colors.YELLOW}Ã¢â‚¬Â¢{Colors.END} When the window opens, you have a short time to decide",
+            f"  {Colors.YELLOW}Ã¢â‚¬Â¢{Colors.END} Choose to activate it, or let the window close and stay",
+            "",
+            f"{Colors.CYAN}THE CATCH:{Colors.END}\n",
+            f"  {Colors.YELLOW}Ã¢â‚¬Â¢{Colors.END} You can't choose when you goÃ¢â‚¬â€it's random",
+            f"  {Colors.YELLOW}Ã¢â‚¬Â¢{Colors.END} Your three items always come with you",
+            f"  {Colors.YELLOW}Ã¢â‚¬Â¢{Colors.END} Your relationships do NOT come with you",
+            f"  {Colors.YELLOW}Ã¢â‚¬Â¢{Colors.END} Each jump means starting over",
+            "",
+            f"{Colors.CYAN}THE GOAL:{Colors.END}\n",
+        ]))
         slow_print("  Find a time and place where you want to stay.")
         slow_print("  Build something worth staying forÃ¢â‚¬â€people, purpose, freedom.")
         slow_print("  When the window opens and you choose not to leave...")
@@ -437,6 +642,12 @@ class Game:
         
         input(f"\n{Colors.DIM}Press Enter to see where you've landed...{Colors.END}")
     
+    def _eras_for_region(self) -> tuple:
+        """Era pool for the player's region preference"""
+        if self.state.region_preference == RegionPreference.EUROPEAN:
+            return _EUROPEAN_ERAS
+        return _ALL_ERAS  # Worldwide = all eras
+    
     def _enter_random_era(self):
         """Enter a random era"""
         visited_ids = self.state.time_machine.eras_visited
@@ -450,17 +661,11 @@ class Game:
                 self.current_era = debug_era
             else:
                 # Fallback to random if debug era not found
-                if self.state.region_preference == RegionPreference.EUROPEAN:
-                    available_eras = [e for e in ERAS if e['id'] in EUROPEAN_ERA_IDS]
-                else:
-                    available_eras = ERAS
+                available_eras = self._eras_for_region()
                 self.current_era = select_random_era(available_eras, visited_ids)
         else:
             # Normal random era selection
-            if self.state.region_preference == RegionPreference.EUROPEAN:
-                available_eras = [e for e in ERAS if e['id'] in EUROPEAN_ERA_IDS]
-            else:
-                available_eras = ERAS  # Worldwide = all eras
+            available_eras = self._eras_for_region()
             
             self.current_era = select_random_era(available_eras, visited_ids)
         
@@ -515,29 +720,36 @@ class Game:
         """Show a brief summary of the era's main themes"""
         era = self.current_era
         
-        print(f"{Colors.CYAN}Ã¢â€ÂÃ¢â€ÂÃ¢â€Â About This Era Ã¢â€ÂÃ¢â€ÂÃ¢â€Â{Colors.END}")
-        print()
-        
         # Location and time context
         year = era.get('year', 0)
-        if year < 0:
-            year_str = f"{abs(year)} BCE"
-        else:
-            year_str = f"{year} CE"
-        print(f"  {Colors.DIM}You are in {era.get('location', 'an unknown place')}, {year_str}.{Colors.END}")
-        print()
+        year_str = f"{abs(year)} BCE" if year < 0 else f"{year} CE"
+        location = era.get('location', 'an unknown place')
+        
+        lines = [
+            f"{Colors.CYAN}Ã¢â€ÂÃ¢â€ÂÃ¢â€Â About This Era Ã¢â€ÂÃ¢â€ÂÃ¢â€Â{Colors.END}",
+            "",
+            f"  {Colors.DIM}You are in {location}, {year_str}.{Colors.END}",
+            "",
+        ]
         
         # Get key events as summary points (up to 5)
         key_events = era.get('key_events', [])[:5]
-        
         if key_events:
-            print(f"  {Colors.YELLOW}What defines this time:{Colors.END}")
-            for event in key_events:
-                print(f"    Ã¢â‚¬Â¢ {event}")
-            print()
+            lines.append(f"  {Colors.YELLOW}What defines this time:{Colors.END}")
+            lines.extend(f"    Ã¢â‚¬Â¢ {event}" for event in key_events)
+            lines.append("")
         
-        print(f"{Colors.CYAN}Ã¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€Â{Colors.END}")
-        print()
+        lines.append(f"{Colors.CYAN}Ã¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€ÂÃ¢â€Â{Colors.END}")
+        lines.append("")
+        
+        # One write for the whole panel
+        print('\n'.join(lines))
+    
+    def _print_era_header(self):
+        """Dim "<era> | <time spent>" line at the top of each turn"""
+        era_state = self.state.current_era
+        if era_state and self.current_era:
+            print(f"{Colors.DIM}{self.current_era['name']} | {era_state.time_in_era_description}{Colors.END}\n")
     
     def _play_turn(self):
         """Play a single turn"""
@@ -573,31 +785,36 @@ class Game:
                 return
             # Otherwise B or C = continue (will generate next turn)
         
-        # Roll dice for this turn
-        roll = roll_dice()
+        # Roll dice for this turn (animated below, once the request is sent)
+        roll = roll_dice(show=False)
         
         # IMPORTANT: Advance turn FIRST to check if window opens
         # This lets us decide which prompt to use BEFORE generating narrative
         events = self.state.advance_turn()
         
-        clear_screen()
-        if self.state.current_era:
-            print(f"{Colors.DIM}{self.current_era['name']} | {self.state.current_era.time_in_era_description}{Colors.END}\n")
+        def show_turn_intro():
+            # Runs while the narrator request is in flight
+            show_roll(roll)
+            clear_screen()
+            self._print_era_header()
+            
+            if events["window_opened"]:
+                # Show window opened header (one write)
+                print('\n'.join([
+                    f"{Colors.GREEN}{'═' * 50}{Colors.END}",
+                    f"{Colors.GREEN}  THE WINDOW IS OPEN{Colors.END}",
+                    f"{Colors.GREEN}{'═' * 50}{Colors.END}",
+                    "",
+                ]))
+                
+                if self.state.can_stay_meaningfully:
+                    print(f"{Colors.YELLOW}You've built something here. You could stay forever...{Colors.END}\n")
         
         # If window just opened, generate window-aware response instead of normal turn
         if events["window_opened"]:
-            # Show window opened header
-            print(f"{Colors.GREEN}{'═' * 50}{Colors.END}")
-            print(f"{Colors.GREEN}  THE WINDOW IS OPEN{Colors.END}")
-            print(f"{Colors.GREEN}{'═' * 50}{Colors.END}")
-            print()
-            
-            if self.state.can_stay_meaningfully:
-                print(f"{Colors.YELLOW}You've built something here. You could stay forever...{Colors.END}\n")
-            
             # Generate combined turn outcome + window choice narrative
             prompt = self._get_combined_turn_and_window_prompt(choice, roll)
-            response = self.narrator.generate(prompt)
+            response = self.narrator.generate(prompt, while_waiting=show_turn_intro)
             
             # Record narrative in history
             if self.current_game:
@@ -605,7 +822,7 @@ class Game:
         else:
             # Normal turn - generate standard response
             prompt = get_turn_prompt(self.state, choice, roll)
-            response = self.narrator.generate(prompt)
+            response = self.narrator.generate(prompt, while_waiting=show_turn_intro)
             
             # Record narrative in history
             if self.current_game:
@@ -715,31 +932,22 @@ IMPORTANT: Put the <anchors> tag on its own line AFTER all three choices."""
     
     def _show_device_status(self):
         """Show time machine indicator status"""
-        indicator = self.state.time_machine.indicator
-        
-        if indicator == IndicatorState.DARK:
-            status = f"{Colors.DIM}[Device: silent]{Colors.END}"
-        elif indicator == IndicatorState.FAINT_PULSE:
-            status = f"{Colors.DIM}[Device: faint pulse]{Colors.END}"
-        elif indicator == IndicatorState.STEADY_GLOW:
-            status = f"{Colors.YELLOW}[Device: glowing steadily]{Colors.END}"
-        elif indicator == IndicatorState.BRIGHT_PULSE:
-            status = f"{Colors.GREEN}[Device: WINDOW OPEN]{Colors.END}"
-        
-        print(f"\n{status}")
+        print(self._DEVICE_STATUS[self.state.time_machine.indicator])
     
     def _handle_window_open(self):
         """Handle when travel window opens - generate new choices including leave option"""
         # Clear screen to make it clear we're in a new moment
         clear_screen()
         
-        if self.current_era:
-            print(f"{Colors.DIM}{self.current_era['name']} | {self.state.current_era.time_in_era_description}{Colors.END}\n")
+        self._print_era_header()
         
-        print(f"{Colors.GREEN}{'Ã¢â€¢Â' * 50}{Colors.END}")
-        print(f"{Colors.GREEN}  THE WINDOW IS OPEN{Colors.END}")
-        print(f"{Colors.GREEN}{'Ã¢â€¢Â' * 50}{Colors.END}")
-        print()
+        # Banner in one write
+        print('\n'.join([
+            f"{Colors.GREEN}{'Ã¢â€¢Â' * 50}{Colors.END}",
+            f"{Colors.GREEN}  THE WINDOW IS OPEN{Colors.END}",
+            f"{Colors.GREEN}{'Ã¢â€¢Â' * 50}{Colors.END}",
+            "",
+        ]))
         
         if self.state.can_stay_meaningfully:
             print(f"{Colors.YELLOW}You've built something here. You could stay forever...{Colors.END}\n")
@@ -908,13 +1116,6 @@ IMPORTANT: Put the <anchors> tag on its own line AFTER all three choices."""
         used_items = parse_item_usage(response, self.state.inventory)
         for item_id in used_items:
             self.state.inventory.use_item(item_id)
-        
-        # Extract choices for validation
-        choices = self._parse_choices(response)
-        
-        # Store in era state
-        if self.state.current_era and choices:
-            self.state.current_era.events.append(f"Turn {self.state.current_era.turns_in_era}")
     
     def _parse_choices(self, response: str) -> list:
         """Extract choices from response"""
@@ -922,17 +1123,15 @@ IMPORTANT: Put the <anchors> tag on its own line AFTER all three choices."""
         clean_response = strip_anchor_tags(response)
         
         choices = []
-        for line in clean_response.split('\n'):
-            line = line.strip()
-            match = re.match(r'^\[([A-C])\]\s*(.+)$', line, re.IGNORECASE)
-            if match:
-                choice_text = match.group(2).strip()
-                # Remove any trailing score tags or other artifacts
-                choice_text = re.sub(r'\s*<[^>]+>.*$', '', choice_text)
-                choice_text = re.sub(r'\s*SCORES:.*$', '', choice_text, flags=re.IGNORECASE)
-                if choice_text and len(choice_text) > 3:
-                    choices.append({'id': match.group(1).upper(), 'text': choice_text})
-        return choices[:3]
+        for match in _CHOICE_RE.finditer(clean_response):
+            # Remove any trailing score tags or other artifacts
+            choice_text = _TAG_TAIL_RE.sub('', match.group(2))
+            choice_text = _SCORES_RE.sub('', choice_text)
+            if len(choice_text) > 3:
+                choices.append({'id': match.group(1).upper(), 'text': choice_text})
+                if len(choices) == 3:
+                    break
+        return choices
 
 
 def main():
@@ -18,19 +18,24 @@ import json
 import random
 import re
 import os
-from typing import Optional, Generator, Dict, Any, List
+import queue
+import threading
+import time
+from functools import lru_cache
+from operator import itemgetter
+from typing import Optional, Generator, Dict, Any, List, Callable
 from datetime import datetime
 from dataclasses import dataclass, asdict
 
-# Try to import anthropic
+# Faster JSON for save files when available; stdlib json otherwise
 try:
-    import anthropic
-    ANTHROPIC_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    ANTHROPIC_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 # Local imports
-from config import EUROPEAN_ERA_IDS, get_debug_era_id
+from config import EUROPEAN_ERA_IDS, get_debug_era_id, NARRATOR_MODEL
 from game_state import GameState, GameMode, GamePhase, RegionPreference
 from time_machine import select_random_era, IndicatorState
 from fulfillment import parse_anchor_adjustments, strip_anchor_tags
@@ -47,12 +52,57 @@ from prompts import (
 )
 from scoring import calculate_score, Leaderboard, AoAEntry, AnnalsOfAnachron
 from db_storage import DatabaseSaveManager, DatabaseLeaderboardStorage, DatabaseGameHistory
+from response_cache import ResponseCache
+from history_summary import HistorySummarizer, cached_request
 from choice_intent import (
     ChoiceIntent, detect_choice_intent, filter_choices, 
     get_choice_intent_for_submission
 )
 
 
+# Era pools by region, built once - ERAS never changes at runtime
+_ALL_ERAS = tuple(ERAS)
+_EUROPEAN_ERAS = tuple(e for e in ERAS if e['id'] in EUROPEAN_ERA_IDS)
+
+# Leaderboard and Annals front the Express API and keep no per-game state,
+# so every session shares one of each
+_LEADERBOARD = Leaderboard(storage=DatabaseLeaderboardStorage())
+_ANNALS = AnnalsOfAnachron()
+
+# Saves are keyed by (user_id, game_id), so sessions also share one save
+# manager - and with it one background writer thread
+_SAVE_MANAGER = DatabaseSaveManager()
+
+# Fixed intro and ending text, sent as-is to every game
+_INTRO_PARAGRAPHS = (
+    "Twenty-four. Stanford. Six figures. A life that looks perfect and feels like nothing.",
+    "So when the lab needed a volunteer for the time machine's first human trial, you stepped up without thinking. Thirty seconds into the past. What could go wrong?",
+    "Everything, it turns out.",
+    "The machine is broken. You can't go home. All you have is what was in your pockets:",
+)
+_DEVICE_MECHANICS = (
+    "The window to use the machine won't open immediately when you arrive somewhere new",
+    "You'll have time to settle in first—typically most of a year",
+    "When the window opens, you have a short time to decide",
+    "Choose to activate it, or let the window close and stay",
+)
+_DEVICE_CATCH = (
+    "You can't choose where or when you go—it's random",
+    "Your three items always come with you",
+    "Your relationships do NOT come with you",
+    "Each jump means starting over",
+)
+_STAY_FOREVER_MESSAGES = (
+    "You reach for the device on your wrist...",
+    "And then you stop.",
+    "This is your home now.",
+)
+_QUIT_MESSAGES = (
+    "You set down the device.",
+    "Some journeys end before the destination is found.",
+)
+
+
 # =============================================================================
 # MESSAGE TYPES
 # =============================================================================
@@ -116,10 +166,155 @@ def emit(msg_type: str, data: Dict[str, Any] = None) -> Dict[str, Any]:
     }
 
 
+def emit_chunk(text: str) -> Dict[str, Any]:
+    """
+    Streamed narrative fragment. Sent dozens of times per response, so it
+    skips the timestamp (and its clock read and isoformat) - the client
+    treats timestamps as optional and chunks are rendered on arrival.
+    """
+    return {"type": MessageType.NARRATIVE_CHUNK, "data": {"text": text}}
+
+
 # =============================================================================
 # NARRATIVE ENGINE (JSON-based)
 # =============================================================================
 
+# Choice lines ("[A] Do something") and trailing artifacts to trim from them.
+# Multiline, so one finditer over the response finds every choice line;
+# group 2 is the text with surrounding whitespace already excluded.
+_CHOICE_RE = re.compile(r'^[^\S\n]*\[([A-C])\][^\S\n]*([^\n]*\S)', re.IGNORECASE | re.MULTILINE)
+_TAG_TAIL_RE = re.compile(r'\s*<[^>]+>.*$')
+_SCORES_RE = re.compile(r'\s*SCORES:.*$', re.IGNORECASE)
+
+# Canned narration for demo mode (no API key or anthropic not installed)
+_DEMO_ARRIVAL = """You stumble forward, catching yourself against rough stone. The air hits you first—woodsmoke, animal dung, something cooking. Your ears ring from the transition.
+
+When your vision clears, you see a narrow street of packed earth. Wooden buildings lean against each other, their upper floors jutting out. People in rough wool and leather stop to stare at your strange clothing.
+
+A woman carrying a basket of bread crosses herself and hurries past. A dog barks. Somewhere nearby, a hammer rings against metal.
+
+You are Thomas the Stranger now—that's what they'll call you. Your device hangs cool against your chest, dormant. Your three items are hidden beneath your coat. You need shelter before dark, and you need to figure out when and where you are.
+
+A tavern sign creaks in the wind ahead. To your left, a church bell tower rises above the rooftops. To your right, a blacksmith's forge glows orange through an open door.
+
+[A] Head to the tavern - travelers gather there, and you need information
+[B] Make for the church - sanctuary and perhaps a sympathetic ear
+[C] Approach the blacksmith - honest work might earn trust faster than questions
+
+<anchors>belonging[0] legacy[0] freedom[0]</anchors>"""
+
+_DEMO_TURN = """Your choice sets events in motion. The day unfolds with unexpected consequences.
+
+People are beginning to know your face now. Some nod in recognition. Others still eye you with suspicion. This place is becoming familiar, for better or worse.
+
+[A] Press forward with your current path
+[B] Seek out someone you've met before
+[C] Take time to observe and plan
+
+<anchors>belonging[+3] legacy[+1] freedom[+2]</anchors>"""
+
+# Seconds without a streamed chunk before a narrator call is given up on
+STREAM_STALL_TIMEOUT = 30.0
+
+# Streamed text is sent on once this many characters have built up, or this
+# long after the last send - fewer, larger messages at no visible delay
+CHUNK_MIN_CHARS = 64
+CHUNK_MAX_DELAY = 0.05
+
+# A sentence or line plus its trailing whitespace, for demo-mode streaming
+_SENTENCE_RE = re.compile(r'.*?(?:[.!?]+["\')\]]*\s+|\n+|$)', re.DOTALL)
+
+
+@lru_cache(maxsize=1)
+def _make_client():
+    """
+    Anthropic client, or None to run in demo mode.
+    
+    The SDK pulls in httpx, pydantic and dozens of submodules, so it is
+    imported here - when the first game starts - rather than at module load.
+    Saved-game listing, leaderboards and other flows that never narrate skip
+    it. Set ANACHRON_DEMO=1 to force demo mode without importing it at all.
+    
+    Built once and shared by every NarrativeEngine: the client is thread-safe,
+    and sharing it keeps one HTTP connection pool warm across games, loads
+    and sessions instead of opening a new one per engine.
+    """
+    if os.environ.get("ANACHRON_DEMO"):
+        return None
+    try:
+        import anthropic
+    except ImportError:
+        return None
+    return anthropic.Anthropic()
+
+
+class HiddenTagFilter:
+    """
+    Removes the narrator's hidden tags (<anchors>, <character_name>,
+    <key_npc>, <wisdom>) from streamed text in a single pass.
+
+    Each character is examined once, so the cost is O(n) over the response
+    however the chunks are split. Only characters that could still open a
+    hidden tag are held back; all other text is returned immediately.
+    Tag names are matched case-insensitively.
+    """
+
+    # Tags the narrator embeds for the game that must never reach the player
+    HIDDEN_TAGS = ("anchors", "character_name", "key_npc", "wisdom")
+    OPEN_TAGS = tuple(f"<{name}>" for name in HIDDEN_TAGS)
+
+    def __init__(self):
+        self.pending = ""       # Held-back prefix of a possible opening tag
+        self.close_tag = None   # Closing tag being looked for while hidden
+        self.match_pos = 0      # Characters of close_tag matched so far
+
+    def feed(self, text: str) -> str:
+        """Filter one streamed chunk, returning the part to show"""
+        visible = []
+        for char in text:
+            self._step(char, visible)
+        return ''.join(visible)
+
+    def flush(self) -> str:
+        """End of stream - release a held-back partial opening tag"""
+        remainder = self.pending if self.close_tag is None else ""
+        self.pending = ""
+        self.close_tag = None
+        self.match_pos = 0
+        return remainder
+
+    def _step(self, char: str, visible: list):
+        """Advance the filter by one character"""
+        if self.close_tag is not None:
+            lower = char.lower()
+            if lower == self.close_tag[self.match_pos]:
+                self.match_pos += 1
+                if self.match_pos == len(self.close_tag):
+                    self.close_tag = None
+                    self.match_pos = 0
+            else:
+                self.match_pos = 1 if char == '<' else 0
+            return
+        
+        if not self.pending and char != '<':
+            visible.append(char)
+            return
+        
+        candidate = (self.pending + char).lower()
+        if any(tag.startswith(candidate) for tag in self.OPEN_TAGS):
+            if candidate in self.OPEN_TAGS:
+                self.close_tag = "</" + candidate[1:]
+                self.pending = ""
+            else:
+                self.pending += char
+        else:
+            # Not a hidden tag after all - release what was held and
+            # re-check this char, which may itself open a tag ("<<wisdom>")
+            visible.append(self.pending)
+            self.pending = ""
+            self._step(char, visible)
+
+
 class NarrativeEngine:
     """Handles AI-generated narrative with JSON output"""
     
@@ -128,10 +323,9 @@ class NarrativeEngine:
         self.messages = []
         self.system_prompt = ""
         
-        if ANTHROPIC_AVAILABLE:
-            self.client = anthropic.Anthropic()
-        else:
-            self.client = None
+        self.client = _make_client()
+        self.cache = ResponseCache.from_env()  # Opt-in replay cache, shared process-wide
+        self.history = HistorySummarizer(self.client)  # Rolling summary of aged-out rounds
     
     def set_era(self, era: dict):
         """Set up system prompt for current era"""
@@ -151,172 +345,307 @@ class NarrativeEngine:
         Generate narrative response with streaming.
         Yields message dicts, returns full response.
         """
+        self.history.apply(self.messages)  # Fold in a finished summary, if any
         self.messages.append({"role": "user", "content": user_prompt})
         
         if not self.client:
             response = self._demo_response(user_prompt)
-            # Simulate streaming for demo mode
-            words = response.split(' ')
-            for i, word in enumerate(words):
-                chunk = word + (' ' if i < len(words) - 1 else '')
-                yield emit(MessageType.NARRATIVE_CHUNK, {"text": chunk})
+            # Simulate streaming for demo mode, a sentence per chunk
+            for chunk in _SENTENCE_RE.findall(response):
+                if chunk:
+                    yield emit_chunk(chunk)
         else:
             response = yield from self._api_call_streaming()
         
         self.messages.append({"role": "assistant", "content": response})
+        self.history.schedule(self.messages)
         return response
     
-    def generate(self, user_prompt: str) -> str:
-        """Generate narrative response (non-streaming)"""
-        self.messages.append({"role": "user", "content": user_prompt})
-        
-        if not self.client:
-            response = self._demo_response(user_prompt)
-        else:
-            response = self._api_call()
-        
-        self.messages.append({"role": "assistant", "content": response})
-        return response
+    def generate(self, user_prompt: str, on_text: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Generate narrative response in one call.
+        Runs on the streaming path; on_text, if given, receives each visible
+        chunk as it arrives. Returns the full (untrimmed) response.
+        """
+        generator = self.generate_streaming(user_prompt)
+        try:
+            while True:
+                msg = next(generator)
+                if on_text and msg["type"] == MessageType.NARRATIVE_CHUNK:
+                    on_text(msg["data"]["text"])
+        except StopIteration as e:
+            return e.value or ""
     
     def _api_call_streaming(self) -> Generator[Dict, None, str]:
         """Make streaming API call, yield chunks, return full response"""
-        response = ""
-        buffer = ""
-        in_hidden_tag = False
-        
-        # Tags that should be hidden from the player
-        hidden_tag_patterns = ['<anchors>', '<character_name>', '<key_npc>', '<wisdom>']
+        parts = []
+        hidden_filter = HiddenTagFilter()
+        
+        cache_key = None
+        if self.cache:
+            cache_key = ResponseCache.key(self.system_prompt, self.messages)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                visible = hidden_filter.feed(cached) + hidden_filter.flush()
+                if visible:
+                    yield emit_chunk(visible)
+                return cached
+        
+        # The SDK stream blocks, so it runs on a reader thread; waiting on
+        # the queue with a timeout stops a stalled stream from hanging the turn
+        chunks = queue.Queue()
+        abandoned = threading.Event()
+        reader = threading.Thread(target=self._read_stream, args=(chunks, abandoned), daemon=True)
+        
+        # Visible text not yet sent, when text was last sent, and when the
+        # stream last delivered anything
+        pending = []
+        pending_len = 0
+        last_sent = last_received = time.monotonic()
         
         try:
-            with self.client.messages.stream(
-                model="claude-sonnet-4-20250514",
-                max_tokens=1500,
-                system=self.system_prompt,
-                messages=self.messages
-            ) as api_stream:
-                for text in api_stream.text_stream:
-                    response += text
-                    buffer += text
-                    
-                    # Check for any hidden tag opening
-                    for tag_start in hidden_tag_patterns:
-                        if tag_start in buffer and not in_hidden_tag:
-                            before_tag = buffer.split(tag_start)[0]
-                            if before_tag:
-                                yield emit(MessageType.NARRATIVE_CHUNK, {"text": before_tag})
-                            buffer = tag_start + buffer.split(tag_start, 1)[1]
-                            in_hidden_tag = True
-                            break
-                    
-                    # Check for tag closing
-                    if in_hidden_tag:
-                        # Check for any closing tag
-                        closing_tags = ['</anchors>', '</character_name>', '</key_npc>', '</wisdom>']
-                        for close_tag in closing_tags:
-                            if close_tag in buffer:
-                                after_tag = buffer.split(close_tag, 1)[1] if close_tag in buffer else ''
-                                buffer = after_tag
-                                in_hidden_tag = False
-                                break
-                    
-                    # Emit non-tag content
-                    if not in_hidden_tag and '<' not in buffer:
-                        if buffer:
-                            yield emit(MessageType.NARRATIVE_CHUNK, {"text": buffer})
-                        buffer = ""
-                    elif not in_hidden_tag and '<' in buffer and '>' in buffer:
-                        # Check if this is a hidden tag
-                        is_hidden = any(tag in buffer for tag in hidden_tag_patterns)
-                        if not is_hidden:
-                            yield emit(MessageType.NARRATIVE_CHUNK, {"text": buffer})
-                            buffer = ""
+            reader.start()
+            while True:
+                now = time.monotonic()
+                timeout = STREAM_STALL_TIMEOUT - (now - last_received)
+                if pending:
+                    # Wake in time to send held text CHUNK_MAX_DELAY after the last send
+                    timeout = min(timeout, CHUNK_MAX_DELAY - (now - last_sent))
+                try:
+                    text = chunks.get(timeout=max(0.0, timeout))
+                except queue.Empty:
+                    if pending:
+                        yield emit_chunk("".join(pending))
+                        pending.clear()
+                        pending_len = 0
+                        last_sent = time.monotonic()
+                        continue
+                    raise TimeoutError(
+                        f"Narrator stream stalled (no text for {STREAM_STALL_TIMEOUT:.0f}s)"
+                    )
+                
+                if text is None:
+                    break
+                if isinstance(text, Exception):
+                    raise text
+                
+                last_received = time.monotonic()
+                parts.append(text)
+                visible = hidden_filter.feed(text)
+                if visible:
+                    pending.append(visible)
+                    pending_len += len(visible)
+                    now = time.monotonic()
+                    if pending_len >= CHUNK_MIN_CHARS or now - last_sent >= CHUNK_MAX_DELAY:
+                        yield emit_chunk("".join(pending))
+                        pending.clear()
+                        pending_len = 0
+                        last_sent = now
             
-            # Emit remaining buffer after cleaning all hidden tags
-            if buffer and not in_hidden_tag:
-                clean_buffer = buffer
-                clean_buffer = re.sub(r'<anchors>.*?</anchors>', '', clean_buffer, flags=re.DOTALL)
-                clean_buffer = re.sub(r'<character_name>.*?</character_name>', '', clean_buffer, flags=re.DOTALL | re.IGNORECASE)
-                clean_buffer = re.sub(r'<key_npc>.*?</key_npc>', '', clean_buffer, flags=re.DOTALL | re.IGNORECASE)
-                clean_buffer = re.sub(r'<wisdom>.*?</wisdom>', '', clean_buffer, flags=re.DOTALL | re.IGNORECASE)
-                if clean_buffer.strip():
-                    yield emit(MessageType.NARRATIVE_CHUNK, {"text": clean_buffer})
+            # Release a held-back "<..." that never became a hidden tag
+            remainder = hidden_filter.flush()
+            if remainder.strip():
+                pending.append(remainder)
+            if pending:
+                yield emit_chunk("".join(pending))
+                pending.clear()
+            
+            response = "".join(parts)
+            if cache_key:
+                self.cache.put(cache_key, response)
                     
         except Exception as e:
+            if pending:
+                yield emit_chunk("".join(pending))
             yield emit(MessageType.ERROR, {"message": str(e)})
             response = self._demo_response("")
+        finally:
+            abandoned.set()  # Stalled or closed early: let the reader stop
         
         return response
     
-    def _api_call(self) -> str:
-        """Make non-streaming API call"""
+    def _read_stream(self, chunks: queue.Queue, abandoned: threading.Event):
+        """
+        Reader thread for _api_call_streaming: put each streamed text chunk
+        on the queue, then any error raised, then None to mark the end.
+        Stops reading once the caller has given up on the stream.
+        """
         try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
+            system, messages = cached_request(self.system_prompt, self.messages)
+            with self.client.messages.stream(
+                model=NARRATOR_MODEL,
                 max_tokens=1500,
-                system=self.system_prompt,
-                messages=self.messages
-            )
-            return response.content[0].text
+                system=system,
+                messages=messages
+            ) as api_stream:
+                for text in api_stream.text_stream:
+                    if abandoned.is_set():
+                        break  # Leaving the with block closes the stream
+                    chunks.put(text)
         except Exception as e:
-            return self._demo_response("")
+            chunks.put(e)
+        finally:
+            chunks.put(None)
     
     def _demo_response(self, prompt: str) -> str:
         """Demo response when API unavailable"""
-        if "arrival" in prompt.lower() or len(self.messages) <= 2:
-            return """You stumble forward, catching yourself against rough stone. The air hits you first—woodsmoke, animal dung, something cooking. Your ears ring from the transition.
+        if len(self.messages) <= 2 or "arrival" in prompt.lower():
+            return _DEMO_ARRIVAL
+        return _DEMO_TURN
 
-When your vision clears, you see a narrow street of packed earth. Wooden buildings lean against each other, their upper floors jutting out. People in rough wool and leather stop to stare at your strange clothing.
 
-A woman carrying a basket of bread crosses herself and hurries past. A dog barks. Somewhere nearby, a hammer rings against metal.
+# =============================================================================
+# GAME SAVE/LOAD MANAGER
+# =============================================================================
 
-You are Thomas the Stranger now—that's what they'll call you. Your device hangs cool against your chest, dormant. Your three items are hidden beneath your coat. You need shelter before dark, and you need to figure out when and where you are.
+# Reused by the stdlib fallback instead of building an encoder per call.
+# Save data is a plain tree, so the per-node circular-reference check is skipped.
+_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), check_circular=False)
 
-A tavern sign creaks in the wind ahead. To your left, a church bell tower rises above the rooftops. To your right, a blacksmith's forge glows orange through an open door.
 
-[A] Head to the tavern - travelers gather there, and you need information
-[B] Make for the church - sanctuary and perhaps a sympathetic ear
-[C] Approach the blacksmith - honest work might earn trust faster than questions
+def _dump_json(data) -> bytes:
+    """Serialize to compact JSON bytes - saves are read by code, not people"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return _JSON_ENCODER.encode(data).encode('utf-8')
 
-<anchors>belonging[0] legacy[0] freedom[0]</anchors>"""
-        else:
-            return """Your choice sets events in motion. The day unfolds with unexpected consequences.
 
-People are beginning to know your face now. Some nod in recognition. Others still eye you with suspicion. This place is becoming familiar, for better or worse.
+def _load_json(raw: bytes):
+    """Parse UTF-8 JSON bytes"""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
-[A] Press forward with your current path
-[B] Seek out someone you've met before
-[C] Take time to observe and plan
 
-<anchors>belonging[+3] legacy[+1] freedom[+2]</anchors>"""
+def _write_atomic(path: str, payload: bytes):
+    """
+    Write payload in one call to a temp file, then swap it into place.
+    A crash mid-save leaves the previous file intact instead of half a file.
+    The directory is created on demand, the first time a write finds it missing.
+    """
+    tmp_path = path + ".tmp"
+    try:
+        f = open(tmp_path, 'wb')
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        f = open(tmp_path, 'wb')
+    with f:
+        f.write(payload)
+    os.replace(tmp_path, path)
 
 
-# =============================================================================
-# GAME SAVE/LOAD MANAGER
-# =============================================================================
+def _remove_quietly(path: str):
+    """os.remove that treats an already-missing file as done"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
 
 class GameSaveManager:
     """Manages saving and loading game states"""
     
+    INDEX_FILENAME = "index.json"  # One per user directory
+    
     def __init__(self, save_dir: str = "saves"):
         self.save_dir = save_dir
+        # user_id -> game_id -> save summary, so listing games never has to
+        # open the saves themselves. Each user's index loads on first use.
+        self._indexes: Dict[str, Dict[str, Dict]] = {}
+        self._index_lock = threading.Lock()
+        self._paths: Dict[tuple, str] = {}  # (user_id, game_id) -> save path
         self._ensure_dir()
     
     def _ensure_dir(self):
         """Ensure save directory exists"""
-        if not os.path.exists(self.save_dir):
-            try:
-                os.makedirs(self.save_dir)
-            except OSError:
-                pass
+        try:
+            os.makedirs(self.save_dir, exist_ok=True)
+        except OSError:
+            pass
     
     def _get_save_path(self, user_id: str, game_id: str) -> str:
-        """Get path for a save file"""
-        return os.path.join(self.save_dir, f"{user_id}_{game_id}.json")
+        """Get path for a save file (built once per game)"""
+        key = (user_id, game_id)
+        path = self._paths.get(key)
+        if path is None:
+            path = self._paths[key] = os.path.join(self._get_user_dir(user_id), f"{game_id}.json")
+        return path
+    
+    def _get_index_path(self, user_id: str) -> str:
+        """Get path for a user's save index"""
+        return os.path.join(self._get_user_dir(user_id), self.INDEX_FILENAME)
     
     def _get_user_dir(self, user_id: str) -> str:
         """Get directory for user's saves"""
         return os.path.join(self.save_dir, user_id)
     
+    def _read_save(self, filepath: str) -> Dict:
+        """Save data from one save file"""
+        with open(filepath, 'rb') as f:
+            return _load_json(f.read())
+    
+    @staticmethod
+    def _summarize(save_data: Dict) -> Dict:
+        """The fields list_user_games reports for one save"""
+        return {
+            "game_id": save_data.get("game_id", ""),
+            "player_name": save_data.get("player_name", "Unknown"),
+            "phase": save_data.get("phase", "unknown"),
+            "current_era": save_data.get("current_era", {}).get("era_name", "Unknown") if save_data.get("current_era") else None,
+            "total_turns": save_data.get("time_machine", {}).get("total_turns", 0),
+            "saved_at": save_data.get("saved_at", ""),
+            "started_at": save_data.get("started_at", "")
+        }
+    
+    def _load_index(self, user_id: str) -> Dict[str, Dict]:
+        """User's index from disk, rebuilt from their saves if missing or unreadable"""
+        index = self._indexes.get(user_id)
+        if index is None:
+            try:
+                with open(self._get_index_path(user_id), 'rb') as f:
+                    index = self._indexes[user_id] = _load_json(f.read())
+            except (OSError, ValueError):
+                index = self._indexes[user_id] = self._rebuild_index(user_id)
+                if index:
+                    self._write_index(user_id)
+        return index
+    
+    def _read_summary(self, filepath: str) -> Optional[Dict]:
+        """Summary of one save file, or None if it can't be read"""
+        try:
+            return self._summarize(self._read_save(filepath))
+        except Exception:
+            return None
+    
+    def _rebuild_index(self, user_id: str) -> Dict[str, Dict]:
+        """Scan the user's save files once to recreate their index"""
+        candidates = {}
+        try:
+            # scandir: names and file types come from the directory listing
+            # itself, no extra stat per entry
+            with os.scandir(self._get_user_dir(user_id)) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.endswith(".json") or name == self.INDEX_FILENAME:
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    candidates[name[:-len(".json")]] = entry.path
+        except OSError:
+            pass  # No saves for this user yet
+        
+        index = {}
+        for key, path in candidates.items():
+            summary = self._read_summary(path)
+            if summary is not None:
+                index[key] = summary
+        return index
+    
+    def _write_index(self, user_id: str):
+        """Rewrite the user's index.json"""
+        try:
+            _write_atomic(self._get_index_path(user_id), _dump_json(self._indexes[user_id]))
+        except OSError as e:
+            print(f"Save index error: {e}")
+    
     def save_game(self, user_id: str, game_id: str, state: GameState) -> bool:
         """
         Save game state to file.
@@ -326,10 +655,11 @@ class GameSaveManager:
             save_data = state.to_save_dict()
             save_data["user_id"] = user_id
             save_data["game_id"] = game_id
+            _write_atomic(self._get_save_path(user_id, game_id), _dump_json(save_data))
             
-            filepath = self._get_save_path(user_id, game_id)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
+            with self._index_lock:
+                self._load_index(user_id)[game_id] = self._summarize(save_data)
+                self._write_index(user_id)
             return True
         except Exception as e:
             print(f"Save error: {e}")
@@ -341,13 +671,10 @@ class GameSaveManager:
         Returns GameState or None if not found.
         """
         try:
-            filepath = self._get_save_path(user_id, game_id)
-            if not os.path.exists(filepath):
+            try:
+                save_data = self._read_save(self._get_save_path(user_id, game_id))
+            except FileNotFoundError:
                 return None
-            
-            with open(filepath, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
-            
             return GameState.from_save_dict(save_data)
         except Exception as e:
             print(f"Load error: {e}")
@@ -356,42 +683,23 @@ class GameSaveManager:
     def delete_game(self, user_id: str, game_id: str) -> bool:
         """Delete a saved game"""
         try:
-            filepath = self._get_save_path(user_id, game_id)
-            if os.path.exists(filepath):
-                os.remove(filepath)
+            _remove_quietly(self._get_save_path(user_id, game_id))
+            
+            with self._index_lock:
+                if self._load_index(user_id).pop(game_id, None) is not None:
+                    self._write_index(user_id)
             return True
         except Exception:
             return False
     
     def list_user_games(self, user_id: str) -> List[Dict]:
-        """List all saved games for a user"""
-        games = []
-        prefix = f"{user_id}_"
+        """List all saved games for a user (from their index, no save files opened)"""
+        with self._index_lock:
+            games = [dict(summary) for summary in self._load_index(user_id).values()]
         
-        try:
-            for filename in os.listdir(self.save_dir):
-                if filename.startswith(prefix) and filename.endswith('.json'):
-                    filepath = os.path.join(self.save_dir, filename)
-                    try:
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            save_data = json.load(f)
-                        
-                        games.append({
-                            "game_id": save_data.get("game_id", ""),
-                            "player_name": save_data.get("player_name", "Unknown"),
-                            "phase": save_data.get("phase", "unknown"),
-                            "current_era": save_data.get("current_era", {}).get("era_name", "Unknown") if save_data.get("current_era") else None,
-                            "total_turns": save_data.get("time_machine", {}).get("total_turns", 0),
-                            "saved_at": save_data.get("saved_at", ""),
-                            "started_at": save_data.get("started_at", "")
-                        })
-                    except Exception:
-                        continue
-        except Exception:
-            pass
-        
-        # Sort by saved_at, newest first
-        games.sort(key=lambda x: x.get("saved_at", ""), reverse=True)
+        # Sort by saved_at, newest first. Every summary has the key, and
+        # isoformat() strings already sort chronologically.
+        games.sort(key=itemgetter("saved_at"), reverse=True)
         return games
 
 
@@ -413,6 +721,24 @@ class GameAPI:
     - Intent-based choice resolution
     """
     
+    # One instance per connected player, so skip the per-instance __dict__
+    __slots__ = (
+        "user_id", "state", "narrator", "current_era", "_selected_region",
+        "history", "current_game", "save_manager", "game_id",
+        "_ending_narrative", "_last_save_ts", "_unsaved",
+    )
+    
+    # Per-turn auto-saves closer together than this (seconds) are coalesced
+    AUTOSAVE_MIN_INTERVAL = 2.0
+    
+    # Device status and description, one per IndicatorState
+    _DEVICE_STATUS = {
+        IndicatorState.DARK: ("silent", "The device is silent and cold."),
+        IndicatorState.FAINT_PULSE: ("faint_pulse", "A faint pulse stirs in the device."),
+        IndicatorState.STEADY_GLOW: ("steady_glow", "The device glows steadily."),
+        IndicatorState.BRIGHT_PULSE: ("window_open", "The device pulses urgently. The window is open."),
+    }
+    
     def __init__(self, user_id: str = "default"):
         self.user_id = user_id
         self.state = GameState()
@@ -424,14 +750,20 @@ class GameAPI:
         self.history = DatabaseGameHistory()
         self.current_game = None
         
-        # Save manager (database-backed)
-        self.save_manager = DatabaseSaveManager()
+        # Save manager (database-backed, shared)
+        self.save_manager = _SAVE_MANAGER
         
-        # Game ID for this session
-        self.game_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Game ID for this session - start time for readability, plus a random
+        # suffix so games started in the same second never share a save slot
+        self.game_id = f"{time.strftime('%Y%m%d_%H%M%S')}_{os.urandom(3).hex()}"
         
         # Ending narrative for stay-forever endings
         self._ending_narrative = ""
+        
+        # Auto-save debounce: when the last save happened, and whether a
+        # skipped auto-save left changes unwritten
+        self._last_save_ts = 0.0
+        self._unsaved = False
     
     # =========================================================================
     # GAME FLOW
@@ -480,12 +812,7 @@ class GameAPI:
         
         # Intro story
         yield emit(MessageType.INTRO_STORY, {
-            "paragraphs": [
-                "Twenty-four. Stanford. Six figures. A life that looks perfect and feels like nothing.",
-                "So when the lab needed a volunteer for the time machine's first human trial, you stepped up without thinking. Thirty seconds into the past. What could go wrong?",
-                "Everything, it turns out.",
-                "The machine is broken. You can't go home. All you have is what was in your pockets:"
-            ]
+            "paragraphs": _INTRO_PARAGRAPHS
         })
         
         # Show items
@@ -506,18 +833,8 @@ class GameAPI:
         yield emit(MessageType.INTRO_DEVICE, {
             "title": "THE DEVICE",
             "description": "The time machine is small—about the size of a chunky wristwatch. You wear it on your wrist, hidden under your sleeve.",
-            "mechanics": [
-                "The window to use the machine won't open immediately when you arrive somewhere new",
-                "You'll have time to settle in first—typically most of a year",
-                "When the window opens, you have a short time to decide",
-                "Choose to activate it, or let the window close and stay"
-            ],
-            "catch": [
-                "You can't choose where or when you go—it's random",
-                "Your three items always come with you",
-                "Your relationships do NOT come with you",
-                "Each jump means starting over"
-            ],
+            "mechanics": _DEVICE_MECHANICS,
+            "catch": _DEVICE_CATCH,
             "goal": "Find a time and place where you want to stay. Build something worth staying for—people, purpose, freedom. When the window opens and you choose not to leave... that's when you've found happiness."
         })
         
@@ -533,11 +850,12 @@ class GameAPI:
     
     def save_game(self) -> Generator[Dict, None, None]:
         """Save current game state"""
-        # Store conversation history in state
-        if self.narrator:
-            self.state.conversation_history = self.narrator.get_conversation_history()
-        
-        success = self.save_manager.save_game(self.user_id, self.game_id, self.state)
+        # Auto-saves post in the background; an explicit save waits for its
+        # result so the player is told the truth
+        success = self._autosave(force=True)
+        if success:
+            self.save_manager.flush(self.user_id, self.game_id)
+            success = self.save_manager.save_error(self.user_id, self.game_id) is None
         
         yield emit(MessageType.GAME_SAVED, {
             "success": success,
@@ -545,8 +863,34 @@ class GameAPI:
             "message": "Game saved successfully" if success else "Failed to save game"
         })
     
+    def _autosave(self, force: bool = False) -> bool:
+        """
+        Persist the game. Unforced (per-turn) saves that come within
+        AUTOSAVE_MIN_INTERVAL of the last save are skipped; the next save,
+        or flush_autosave(), writes their changes.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_save_ts < self.AUTOSAVE_MIN_INTERVAL:
+            self._unsaved = True
+            return True
+        
+        # Store conversation history in state
+        if self.narrator:
+            self.state.conversation_history = self.narrator.get_conversation_history()
+        
+        success = self.save_manager.save_game(self.user_id, self.game_id, self.state)
+        self._last_save_ts = now
+        self._unsaved = not success
+        return success
+    
+    def flush_autosave(self):
+        """Write changes from an auto-save the debounce skipped"""
+        if self._unsaved:
+            self._autosave(force=True)
+    
     def load_game(self, game_id: str) -> Generator[Dict, None, None]:
         """Load a saved game"""
+        self.flush_autosave()  # Don't drop the current game's last turn
         loaded_state = self.save_manager.load_game(self.user_id, game_id)
         
         if not loaded_state:
@@ -597,18 +941,12 @@ class GameAPI:
         
         # Current era info
         if self.state.current_era and self.current_era:
-            year = self.current_era['year']
-            year_str = f"{abs(year)} BCE" if year < 0 else f"{year} CE"
-            
-            resume_data["era"] = {
-                "name": self.current_era['name'],
-                "year": year,
-                "year_display": year_str,
-                "location": self.current_era['location'],
-                "time_in_era": self.state.current_era.time_in_era_description,
-                "turns_in_era": self.state.current_era.turns_in_era + 1,
-                "era_number": self.state.eras_count
-            }
+            era_view = self._era_view()
+            year = era_view["year"]
+            era_view["year_display"] = f"{abs(year)} BCE" if year < 0 else f"{year} CE"
+            era_view["turns_in_era"] = self.state.current_era.turns_in_era + 1
+            era_view["era_number"] = self.state.eras_count
+            resume_data["era"] = era_view
         
         # Device status
         resume_data["device"] = {
@@ -665,7 +1003,7 @@ class GameAPI:
     
     def get_leaderboard(self, global_board: bool = True, limit: int = 10) -> Generator[Dict, None, None]:
         """Get leaderboard data"""
-        leaderboard = Leaderboard(storage=DatabaseLeaderboardStorage())
+        leaderboard = _LEADERBOARD
         
         if global_board:
             scores = leaderboard.get_top_scores(limit)
@@ -687,7 +1025,7 @@ class GameAPI:
             limit: Number of entries per page (max 20)
             offset: Pagination offset
         """
-        annals = AnnalsOfAnachron()
+        annals = _ANNALS
         
         if user_only:
             result = annals.get_user_archive(self.user_id, limit=min(limit, 20), offset=offset)
@@ -723,7 +1061,7 @@ class GameAPI:
         """
         Get a single Annals entry by ID (for detail view / sharing).
         """
-        annals = AnnalsOfAnachron()
+        annals = _ANNALS
         entry = annals.get_entry(entry_id)
         
         if not entry:
@@ -880,18 +1218,7 @@ class GameAPI:
             history_prefix = ""
         
         # Generate narrative
-        response = ""
-        generator = self.narrator.generate_streaming(prompt)
-        try:
-            while True:
-                msg = next(generator)
-                yield msg
-        except StopIteration as e:
-            response = e.value if e.value else ""
-        
-        # Fallback if response is empty
-        if not response:
-            response = self.narrator.messages[-1]["content"] if self.narrator.messages else ""
+        response = yield from self._stream_and_collect(prompt)
         
         # Record narrative
         if self.current_game:
@@ -951,9 +1278,7 @@ class GameAPI:
         yield self._get_device_status()
         
         # Auto-save after each turn
-        if self.narrator:
-            self.state.conversation_history = self.narrator.get_conversation_history()
-        self.save_manager.save_game(self.user_id, self.game_id, self.state)
+        self._autosave()
     
     def _re_emit_choices(self) -> Generator[Dict, None, None]:
         """Re-emit the current choices after an error."""
@@ -974,12 +1299,7 @@ class GameAPI:
             "user_id": self.user_id,
             "phase": self.state.phase.value,
             "player_name": self.state.player_name,
-            "era": {
-                "name": self.current_era["name"] if self.current_era else None,
-                "year": self.current_era["year"] if self.current_era else None,
-                "location": self.current_era["location"] if self.current_era else None,
-                "time_in_era": self.state.current_era.time_in_era_description if self.state.current_era else None
-            } if self.current_era else None,
+            "era": self._era_view(),
             "device": {
                 "indicator": self.state.time_machine.indicator.value,
                 "window_active": self.state.time_machine.window_active,
@@ -996,6 +1316,23 @@ class GameAPI:
     # INTERNAL HELPERS
     # =========================================================================
     
+    def _era_view(self) -> Optional[Dict]:
+        """Current era fields shared by the state snapshot and resume"""
+        if not self.current_era:
+            return None
+        return {
+            "name": self.current_era["name"],
+            "year": self.current_era["year"],
+            "location": self.current_era["location"],
+            "time_in_era": self.state.current_era.time_in_era_description if self.state.current_era else None
+        }
+    
+    def _eras_for_region(self) -> tuple:
+        """Era pool for the player's region preference"""
+        if self.state.region_preference == RegionPreference.EUROPEAN:
+            return _EUROPEAN_ERAS
+        return _ALL_ERAS  # Worldwide = all eras
+    
     def _enter_random_era(self) -> Generator[Dict, None, None]:
         """Enter a random era"""
         visited_ids = self.state.time_machine.eras_visited
@@ -1009,17 +1346,11 @@ class GameAPI:
                 self.current_era = debug_era
             else:
                 # Fallback to random if debug era not found
-                if self.state.region_preference == RegionPreference.EUROPEAN:
-                    available_eras = [e for e in ERAS if e['id'] in EUROPEAN_ERA_IDS]
-                else:
-                    available_eras = ERAS
+                available_eras = self._eras_for_region()
                 self.current_era = select_random_era(available_eras, visited_ids)
         else:
             # Normal random era selection
-            if self.state.region_preference == RegionPreference.EUROPEAN:
-                available_eras = [e for e in ERAS if e['id'] in EUROPEAN_ERA_IDS]
-            else:
-                available_eras = ERAS
+            available_eras = self._eras_for_region()
             
             self.current_era = select_random_era(available_eras, visited_ids)
         self.state.enter_era(self.current_era)
@@ -1075,19 +1406,7 @@ class GameAPI:
         
         # Generate arrival narrative
         prompt = get_arrival_prompt(self.state, self.current_era)
-        response = ""
-        
-        # Stream the narrative - capture full response from generator
-        generator = self.narrator.generate_streaming(prompt)
-        try:
-            while True:
-                msg = next(generator)
-                yield msg
-        except StopIteration as e:
-            response = e.value if e.value else ""
-        
-        if not response:
-            response = self.narrator.messages[-1]["content"] if self.narrator.messages else ""
+        response = yield from self._stream_and_collect(prompt)
         
         # Record narrative
         if self.current_game:
@@ -1134,9 +1453,7 @@ class GameAPI:
         yield self._get_device_status()
         
         # Auto-save
-        if self.narrator:
-            self.state.conversation_history = self.narrator.get_conversation_history()
-        self.save_manager.save_game(self.user_id, self.game_id, self.state)
+        self._autosave()
     
     def _handle_leaving(self) -> Generator[Dict, None, None]:
         """Handle player choosing to leave"""
@@ -1151,19 +1468,7 @@ class GameAPI:
         
         # Generate departure narrative
         prompt = get_leaving_prompt(self.state)
-        response = ""
-        
-        # Stream the narrative - capture full response from generator
-        generator = self.narrator.generate_streaming(prompt)
-        try:
-            while True:
-                msg = next(generator)
-                yield msg
-        except StopIteration as e:
-            response = e.value if e.value else ""
-        
-        if not response:
-            response = self.narrator.messages[-1]["content"] if self.narrator.messages else ""
+        response = yield from self._stream_and_collect(prompt)
         
         # Record departure
         if self.current_game:
@@ -1241,30 +1546,14 @@ class GameAPI:
         
         yield emit(MessageType.STAYING_FOREVER, {
             "title": "A NEW HOME",
-            "messages": [
-                "You reach for the device on your wrist...",
-                "And then you stop.",
-                "This is your home now."
-            ]
+            "messages": _STAY_FOREVER_MESSAGES
         })
         
         yield emit(MessageType.LOADING, {"message": "Your story concludes..."})
         
         # Generate ending narrative
         prompt = get_staying_ending_prompt(self.state, self.current_era)
-        response = ""
-        
-        # Stream the narrative - capture full response from generator
-        generator = self.narrator.generate_streaming(prompt)
-        try:
-            while True:
-                msg = next(generator)
-                yield msg
-        except StopIteration as e:
-            response = e.value if e.value else ""
-        
-        if not response:
-            response = self.narrator.messages[-1]["content"] if self.narrator.messages else ""
+        response = yield from self._stream_and_collect(prompt)
         
         # Record ending
         if self.current_game:
@@ -1287,16 +1576,14 @@ class GameAPI:
         yield from self._emit_final_score(ending_narrative=ending_narrative)
         
         # Delete save file (game is complete)
+        self._unsaved = False
         self.save_manager.delete_game(self.user_id, self.game_id)
     
     def _handle_quit(self) -> Generator[Dict, None, None]:
         """Handle player choosing to quit"""
         yield emit(MessageType.GAME_END, {
             "title": "YOUR JOURNEY ENDS",
-            "messages": [
-                "You set down the device.",
-                "Some journeys end before the destination is found."
-            ]
+            "messages": _QUIT_MESSAGES
         })
         
         # Generate quit narrative with historical context
@@ -1304,19 +1591,7 @@ class GameAPI:
             yield emit(MessageType.LOADING, {"message": "Preparing your debrief..."})
             
             prompt = get_quit_ending_prompt(self.state, self.current_era)
-            response = ""
-            
-            # Stream the narrative
-            generator = self.narrator.generate_streaming(prompt)
-            try:
-                while True:
-                    msg = next(generator)
-                    yield msg
-            except StopIteration as e:
-                response = e.value if e.value else ""
-            
-            if not response:
-                response = self.narrator.messages[-1]["content"] if self.narrator.messages else ""
+            response = yield from self._stream_and_collect(prompt)
             
             # Store ending narrative (raw - tags stripped before display)
             self._ending_narrative = response
@@ -1337,6 +1612,7 @@ class GameAPI:
         yield from self._emit_final_score(ending_type_override="abandoned", ending_narrative=ending_narrative)
         
         # Delete save file (game is complete)
+        self._unsaved = False
         self.save_manager.delete_game(self.user_id, self.game_id)
     
     def _emit_final_score(self, ending_type_override: str = None, ending_narrative: str = "") -> Generator[Dict, None, None]:
@@ -1354,13 +1630,13 @@ class GameAPI:
             self.history.end_game(self.current_game, score)
         
         # Add to leaderboard (database-backed)
-        leaderboard = Leaderboard(storage=DatabaseLeaderboardStorage())
+        leaderboard = _LEADERBOARD
         rank = leaderboard.add_score(score)
         
         # Create Annals of Anachron entry if qualified
         aoa_entry = None
         aoa_data = None
-        annals = AnnalsOfAnachron()
+        annals = _ANNALS
         
         # =====================================================================
         # DEBUG: AoA Entry Creation Check
@@ -1484,19 +1760,17 @@ class GameAPI:
     
     def _get_device_status(self) -> Dict:
         """Get device status message"""
-        indicator = self.state.time_machine.indicator
-        
-        status_map = {
-            IndicatorState.DARK: {"status": "silent", "description": "The device is silent and cold."},
-            IndicatorState.FAINT_PULSE: {"status": "faint_pulse", "description": "A faint pulse stirs in the device."},
-            IndicatorState.STEADY_GLOW: {"status": "steady_glow", "description": "The device glows steadily."},
-            IndicatorState.BRIGHT_PULSE: {"status": "window_open", "description": "The device pulses urgently. The window is open."}
+        time_machine = self.state.time_machine
+        status, description = self._DEVICE_STATUS.get(
+            time_machine.indicator, self._DEVICE_STATUS[IndicatorState.DARK]
+        )
+        status_data = {
+            "status": status,
+            "description": description,
+            "window_active": time_machine.window_active,
+            "window_turns_remaining": time_machine.window_turns_remaining,
         }
         
-        status_data = status_map.get(indicator, status_map[IndicatorState.DARK])
-        status_data["window_active"] = self.state.time_machine.window_active
-        status_data["window_turns_remaining"] = self.state.time_machine.window_turns_remaining
-        
         if self.state.current_era:
             status_data["era_number"] = self.state.eras_count
             status_data["turn_in_era"] = self.state.current_era.turns_in_era + 1
@@ -1504,6 +1778,13 @@ class GameAPI:
         
         return emit(MessageType.DEVICE_STATUS, status_data)
     
+    def _stream_and_collect(self, prompt: str) -> Generator[Dict, None, str]:
+        """Stream the narrator's reply to prompt, return the full response"""
+        response = yield from self.narrator.generate_streaming(prompt)
+        if not response:
+            response = self.narrator.messages[-1]["content"] if self.narrator.messages else ""
+        return response
+    
     def _process_response(self, response: str, is_arrival: bool = False) -> Dict:
         """
         Process AI response - extract anchors, items, and log events.
@@ -1562,10 +1843,6 @@ class GameAPI:
                 if wisdom_data:
                     result["wisdom"] = wisdom_data
         
-        # Store turn event in era state
-        if self.state.current_era:
-            self.state.current_era.events.append(f"Turn {self.state.current_era.turns_in_era}")
-        
         # Return feedback data for caller to optionally emit
         return result
     
@@ -1576,20 +1853,18 @@ class GameAPI:
         clean_response = strip_event_tags(clean_response)
         
         choices = []
-        for line in clean_response.split('\n'):
-            line = line.strip()
-            match = re.match(r'^\[([A-C])\]\s*(.+)$', line, re.IGNORECASE)
-            if match:
-                choice_text = match.group(2).strip()
-                choice_text = re.sub(r'\s*<[^>]+>.*$', '', choice_text)
-                choice_text = re.sub(r'\s*SCORES:.*$', '', choice_text, flags=re.IGNORECASE)
-                if choice_text and len(choice_text) > 3:
-                    choices.append({
-                        'id': match.group(1).upper(),
-                        'text': choice_text
-                    })
-        
-        return choices[:3]
+        for match in _CHOICE_RE.finditer(clean_response):
+            choice_text = _TAG_TAIL_RE.sub('', match.group(2))
+            choice_text = _SCORES_RE.sub('', choice_text)
+            if len(choice_text) > 3:
+                choices.append({
+                    'id': match.group(1).upper(),
+                    'text': choice_text
+                })
+                if len(choices) == 3:
+                    break
+        
+        return choices
 
 
 # =============================================================================
@@ -1600,6 +1875,10 @@ class GameSession:
     """
     Simplified wrapper that collects generator output into lists.
     Useful for request/response style APIs (e.g., REST endpoints).
+    
+    The narrating steps also have iter_* variants that hand back the
+    generator itself, so a push transport (Socket.IO, SSE) can send each
+    narrative chunk as it streams instead of after the whole turn.
     """
     
     def __init__(self, user_id: str = "default"):
@@ -1619,24 +1898,44 @@ class GameSession:
     
     def enter_first_era(self) -> List[Dict]:
         """Enter first era"""
-        return list(self.api.enter_first_era())
+        return list(self.iter_enter_first_era())
+    
+    def iter_enter_first_era(self) -> Generator[Dict, None, None]:
+        """Enter first era, yielding messages as they stream"""
+        return self.api.enter_first_era()
     
     def choose(self, choice: str) -> List[Dict]:
         """Make a choice"""
-        return list(self.api.make_choice(choice))
+        return list(self.iter_choose(choice))
+    
+    def iter_choose(self, choice: str) -> Generator[Dict, None, None]:
+        """Make a choice, yielding messages as they stream"""
+        return self.api.make_choice(choice)
     
     def continue_to_next_era(self) -> List[Dict]:
         """Continue after departure"""
-        return list(self.api.continue_to_next_era())
+        return list(self.iter_continue_to_next_era())
+    
+    def iter_continue_to_next_era(self) -> Generator[Dict, None, None]:
+        """Continue after departure, yielding messages as they stream"""
+        return self.api.continue_to_next_era()
     
     def continue_to_score(self) -> List[Dict]:
         """Continue to show final score after ending narrative"""
-        return list(self.api.continue_to_score())
+        return list(self.iter_continue_to_score())
+    
+    def iter_continue_to_score(self) -> Generator[Dict, None, None]:
+        """Continue to the final score, yielding messages as they stream"""
+        return self.api.continue_to_score()
     
     def get_state(self) -> Dict:
         """Get current state"""
         return self.api.get_current_state()
     
+    def flush(self):
+        """Write an auto-save still held back by the debounce"""
+        self.api.flush_autosave()
+    
     def save(self) -> List[Dict]:
         """Save current game"""
         return list(self.api.save_game())
@@ -528,15 +528,15 @@ class GameState:
         
         belonging_data = ff_data.get("belonging", {})
         state.fulfillment.belonging.value = belonging_data.get("value", 0)
-        state.fulfillment.belonging.history = [tuple(h) for h in belonging_data.get("history", [])]
+        state.fulfillment.belonging.restore_history([tuple(h) for h in belonging_data.get("history", [])])
         
         legacy_data = ff_data.get("legacy", {})
         state.fulfillment.legacy.value = legacy_data.get("value", 0)
-        state.fulfillment.legacy.history = [tuple(h) for h in legacy_data.get("history", [])]
+        state.fulfillment.legacy.restore_history([tuple(h) for h in legacy_data.get("history", [])])
         
         freedom_data = ff_data.get("freedom", {})
         state.fulfillment.freedom.value = freedom_data.get("value", 0)
-        state.fulfillment.freedom.history = [tuple(h) for h in freedom_data.get("history", [])]
+        state.fulfillment.freedom.restore_history([tuple(h) for h in freedom_data.get("history", [])])
         
         state.fulfillment.current_turn = ff_data.get("current_turn", 0)
         
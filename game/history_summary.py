@@ -0,0 +1,116 @@
+"""
+Anachron - History Summary Module
+
+Narrator context shared by both engines: the rolling history summary and
+the prompt-cache breakpoints on each request.
+
+Keeps the narrator's conversation short. The last WINDOW_ROUNDS rounds are
+sent verbatim; older ones are folded into a summary pinned as the first
+round. Folding waits until SUMMARY_EVERY rounds have aged out, so it costs
+one short call every few turns.
+
+The summary call runs on a worker thread and its result is applied before
+a later request, so a turn never waits on it. The summary lives in the
+engine's messages, so it is saved with the rest of the conversation.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+from config import NARRATOR_MODEL, WINDOW_ROUNDS, SUMMARY_EVERY
+from prompts import get_history_summary_prompt, HISTORY_SUMMARY_PREFIX
+
+
+class HistorySummarizer:
+    """Folds aged-out rounds of one engine's conversation in the background"""
+
+    def __init__(self, client):
+        self.client = client
+        self._worker = None
+        # (messages list, end index, summary) once the worker has finished
+        self._target = None
+        self._summary = None
+
+    def schedule(self, messages: List[Dict]):
+        """Start a summary call if enough rounds have aged out and none is running"""
+        if not self.client or self._worker is not None:
+            return
+
+        has_summary = (
+            bool(messages)
+            and isinstance(messages[0]["content"], str)
+            and messages[0]["content"].startswith(HISTORY_SUMMARY_PREFIX)
+        )
+        start = 2 if has_summary else 0
+        aged_rounds = (len(messages) - start) // 2 - WINDOW_ROUNDS
+        if aged_rounds < SUMMARY_EVERY:
+            return
+
+        end = start + 2 * aged_rounds
+        previous = messages[0]["content"][len(HISTORY_SUMMARY_PREFIX):].strip() if has_summary else ""
+        prompt = get_history_summary_prompt(previous, messages[start:end])
+
+        self._target = (messages, end)
+        self._summary = None
+        self._worker = threading.Thread(target=self._summarize, args=(prompt,), daemon=True)
+        self._worker.start()
+
+    def _summarize(self, prompt: str):
+        try:
+            result = self.client.messages.create(
+                model=NARRATOR_MODEL,
+                max_tokens=400,
+                timeout=60.0,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            self._summary = result.content[0].text.strip()
+        except Exception:
+            pass  # Keep the full history and try again after the next turn
+
+    def apply(self, messages: List[Dict]):
+        """
+        Fold in a finished summary. Never waits: a summary still in flight
+        is picked up by a later call. Dropped if the conversation was
+        replaced since it was scheduled (new era, load).
+        """
+        worker = self._worker
+        if worker is None or worker.is_alive():
+            return
+
+        target, end = self._target
+        summary = self._summary
+        self._worker = self._target = self._summary = None
+
+        # Messages are only appended between schedule and apply, so the
+        # summarized prefix is still messages[:end]
+        if summary is None or target is not messages or len(messages) < end:
+            return
+        messages[:end] = [
+            {"role": "user", "content": f"{HISTORY_SUMMARY_PREFIX}\n{summary}"},
+            {"role": "assistant", "content": "Understood. Continuing the story from there."}
+        ]
+
+
+def cached_request(system_prompt: str, messages: List[Dict]) -> tuple:
+    """
+    System blocks and messages for the next API call, with prompt-cache
+    breakpoints. The system prompt is fixed for the era and each turn only
+    appends, so everything up to the newest message is reusable by the
+    next call. The engines keep plain string content for saving.
+    """
+    system = [{
+        "type": "text",
+        "text": system_prompt,
+        "cache_control": {"type": "ephemeral"}
+    }]
+    if messages and isinstance(messages[-1]["content"], str):
+        last = messages[-1]
+        messages = messages[:-1] + [{
+            "role": last["role"],
+            "content": [{
+                "type": "text",
+                "text": last["content"],
+                "cache_control": {"type": "ephemeral"}
+            }]
+        }]
+    return system, messages
@@ -8,6 +8,7 @@ Manages the player's items:
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict
 from copy import deepcopy
+from functools import lru_cache
 import re
 
 from config import STARTING_ITEMS
@@ -197,6 +198,31 @@ def get_items_prompt_section(inventory: Inventory) -> str:
     return "\n".join(lines)
 
 
+# Words that suggest an item was put to use when they appear near its name
+_USE_INDICATORS = (
+    "use", "used", "using", "uses",
+    "take out", "took out", "pulls out", "pull out",
+    "show", "showed", "showing", "shows",
+    "give", "gave", "giving", "gives",
+    "consult", "consulted", "check", "checked",
+    "swallow", "take", "took", "administer",
+    "cut", "cutting", "cuts",
+    "light", "lit", "shine", "shining",
+)
+_USE_ALTERNATION = "|".join(re.escape(word) for word in _USE_INDICATORS)
+
+
+@lru_cache(maxsize=64)
+def _usage_pattern(name_part: str):
+    """
+    Any use indicator within 50 characters before or after an item-name
+    word, as one compiled regex - a single search instead of one per
+    indicator.
+    """
+    name = re.escape(name_part)
+    return re.compile(rf'(?:{_USE_ALTERNATION}).{{0,50}}{name}|{name}.{{0,50}}(?:{_USE_ALTERNATION})')
+
+
 def parse_item_usage(response: str, inventory: Inventory) -> List[str]:
     """
     Parse AI response to detect item usage.
@@ -205,17 +231,6 @@ def parse_item_usage(response: str, inventory: Inventory) -> List[str]:
     used_items = []
     response_lower = response.lower()
     
-    use_indicators = [
-        "use", "used", "using", "uses",
-        "take out", "took out", "pulls out", "pull out",
-        "show", "showed", "showing", "shows",
-        "give", "gave", "giving", "gives",
-        "consult", "consulted", "check", "checked",
-        "swallow", "take", "took", "administer",
-        "cut", "cutting", "cuts",
-        "light", "lit", "shine", "shining",
-    ]
-    
     for item in inventory.all_items:
         if item.is_depleted:
             continue
@@ -227,11 +242,8 @@ def parse_item_usage(response: str, inventory: Inventory) -> List[str]:
         for name_part in name_parts:
             if len(name_part) < 4:  # Skip short words
                 continue
-            if name_part in response_lower:
-                for indicator in use_indicators:
-                    pattern = rf'{indicator}.{{0,50}}{re.escape(name_part)}|{re.escape(name_part)}.{{0,50}}{indicator}'
-                    if re.search(pattern, response_lower):
-                        used_items.append(item.id)
-                        break
-    
-    return list(set(used_items))
+            if name_part in response_lower and _usage_pattern(name_part).search(response_lower):
+                used_items.append(item.id)
+                break
+    
+    return used_items
@@ -942,3 +942,33 @@ After the story, add this section:
 Find the "Historical Footnotes" section from the player narrative above and convert to 3rd person.
 Keep the educational content intact - just change "you" to "he/she/they" and "your" to "his/her/their".
 This section teaches real history through the character's journey."""
+
+
+# Marks the pinned first message that carries the rolling summary
+HISTORY_SUMMARY_PREFIX = "[Prior events summary]"
+
+
+def get_history_summary_prompt(previous_summary: str, rounds: list) -> str:
+    """
+    Prompt to fold aged-out conversation rounds into the running summary.
+    
+    Args:
+        previous_summary: Summary so far this era ("" if none yet)
+        rounds: Message dicts being dropped from the window, oldest first
+    """
+    transcript = "\n\n".join(
+        f"{'PLAYER' if m['role'] == 'user' else 'NARRATOR'}: {m['content']}"
+        for m in rounds
+    )
+    earlier = f"SUMMARY SO FAR:\n{previous_summary}\n\n" if previous_summary else ""
+    
+    return f"""You are keeping continuity notes for an interactive historical story.
+
+{earlier}NEW EVENTS:
+{transcript}
+
+Rewrite the summary to cover everything above in 200 words or fewer.
+Keep: names and roles of people met, promises and debts, where the traveler
+lives and works, which modern items were used and how, and unresolved threads.
+Drop: choice menus, dice rolls, atmosphere, and any <tags>.
+Write plain prose, past tense, no headings."""
@@ -0,0 +1,88 @@
+"""
+Anachron - Response Cache Module
+
+Optional on-disk memo of narrator responses, keyed by the exact request
+(system prompt + conversation). Replaying a session, retrying after a quit,
+or re-running the same opening while developing then costs nothing and
+returns instantly instead of calling the API again.
+
+Off by default - cached narration would make real play repeat itself.
+Enable with ANACHRON_RESPONSE_CACHE=<path to cache file>.
+
+shelve is not safe for concurrent writers, so the whole process shares one
+cache per file (one handle, guarded by a lock) and closes it at exit.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import shelve
+import threading
+from typing import Dict, List, Optional
+
+
+# Process-wide caches by path, so every engine shares one shelf handle
+_SHARED = {}
+_SHARED_LOCK = threading.Lock()
+
+
+class ResponseCache:
+    """Shelve-backed map from request hash to full narrator response"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._shelf = None  # Opened on first use
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["ResponseCache"]:
+        """Shared cache configured by ANACHRON_RESPONSE_CACHE, or None when disabled"""
+        path = os.environ.get("ANACHRON_RESPONSE_CACHE")
+        if not path:
+            return None
+        with _SHARED_LOCK:
+            cache = _SHARED.get(path)
+            if cache is None:
+                cache = _SHARED[path] = cls(path)
+                atexit.register(cache.close)
+            return cache
+
+    @staticmethod
+    def key(system_prompt: str, messages: List[Dict]) -> str:
+        """Stable hash of everything the model sees for one call"""
+        payload = json.dumps({"s": system_prompt, "m": messages}, sort_keys=True)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _open(self):
+        if self._shelf is None:
+            self._shelf = shelve.open(self.path)
+        return self._shelf
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached response, or None on a miss or unreadable cache"""
+        with self._lock:
+            try:
+                return self._open().get(key)
+            except Exception:
+                return None
+
+    def put(self, key: str, response: str):
+        """Remember a successful response"""
+        with self._lock:
+            try:
+                shelf = self._open()
+                shelf[key] = response
+                shelf.sync()
+            except Exception:
+                pass  # Caching is best-effort
+
+    def close(self):
+        """Write out and release the shelf; reopened if used again"""
+        with self._lock:
+            if self._shelf is not None:
+                try:
+                    self._shelf.close()
+                except Exception:
+                    pass
+                self._shelf = None
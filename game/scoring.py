@@ -620,6 +620,33 @@ class AnnalsOfAnachron:
             'has_more': offset + len(entries) < total
         }
 
+# =============================================================================
+# LOCAL RECORD FILES (leaderboard, game history)
+# =============================================================================
+
+def _load_records(filepath: str) -> List[dict]:
+    """
+    Load a list of records saved by _save_records.
+    Raises ValueError/IOError on unreadable files, like json.load.
+    """
+    if not os.path.exists(filepath):
+        return []
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _save_records(filepath: str, records: List[dict]):
+    """
+    Save a list of records as JSON.
+    Written to a temp file and swapped in, so a crash mid-write never
+    leaves a truncated leaderboard behind.
+    """
+    tmp_path = filepath + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(records, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, filepath)
+
+
 class LeaderboardStorage(ABC):
     """Abstract interface for leaderboard storage backends"""
     
@@ -659,20 +686,15 @@ class JSONLeaderboardStorage(LeaderboardStorage):
     
     def _load(self):
         """Load leaderboard from file"""
-        if os.path.exists(self.filepath):
-            try:
-                with open(self.filepath, 'r') as f:
-                    self.scores = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                self.scores = []
-        else:
+        try:
+            self.scores = _load_records(self.filepath)
+        except (ValueError, IOError):
             self.scores = []
     
     def _save(self):
         """Save leaderboard to file"""
         try:
-            with open(self.filepath, 'w') as f:
-                json.dump(self.scores, f, indent=2)
+            _save_records(self.filepath, self.scores)
         except IOError:
             pass  # Silently fail if can't save
     
@@ -824,20 +846,15 @@ class GameHistory:
     
     def _load(self):
         """Load history from file"""
-        if os.path.exists(self.filepath):
-            try:
-                with open(self.filepath, 'r', encoding='utf-8') as f:
-                    self.games = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                self.games = []
-        else:
+        try:
+            self.games = _load_records(self.filepath)
+        except (ValueError, IOError):
             self.games = []
     
     def _save(self):
         """Save history to file"""
         try:
-            with open(self.filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.games, f, indent=2, ensure_ascii=False)
+            _save_records(self.filepath, self.games)
         except IOError:
             pass  # Silently fail if can't save
     
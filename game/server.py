@@ -21,7 +21,7 @@ from flask import Flask, request
 from flask_socketio import SocketIO, emit as raw_emit
 
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.DEBUG if os.environ.get('ANACHRON_DEBUG') else logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
@@ -73,7 +73,7 @@ def get_session(sid):
 def handle_connect():
     """Handle new client connection - wait for init event"""
     sid = request.sid
-    logger.info(f"Client connected: {sid}")
+    logger.info("Client connected: %s", sid)
     # Don't create session yet - wait for init event with user_id
 
 
@@ -82,7 +82,7 @@ def handle_init(data):
     """Initialize game session with user_id"""
     sid = request.sid
     user_id = data.get('user_id', 'anonymous')
-    logger.info(f"Initializing session for {sid} with user_id: {user_id}")
+    logger.info("Initializing session for %s with user_id: %s", sid, user_id)
     
     # Create session with user_id
     session = GameSession(user_id=user_id)
@@ -113,9 +113,11 @@ def handle_new_game():
 def handle_disconnect():
     """Handle client disconnection"""
     sid = request.sid
-    logger.info(f"Client disconnected: {sid}")
+    logger.info("Client disconnected: %s", sid)
     
     if sid in sessions:
+        # Write a turn whose auto-save was coalesced before dropping it
+        sessions[sid]['session'].flush()
         del sessions[sid]
 
 
@@ -165,7 +167,7 @@ def handle_enter_first_era():
         return
     
     session = session_data['session']
-    messages = session.enter_first_era()
+    messages = session.iter_enter_first_era()
     for msg in messages:
         emit('message', msg)
 
@@ -180,7 +182,7 @@ def handle_choose(data):
     
     session = session_data['session']
     choice = data.get('choice', 'A')
-    messages = session.choose(choice)
+    messages = session.iter_choose(choice)
     for msg in messages:
         emit('message', msg)
 
@@ -194,7 +196,7 @@ def handle_continue_to_next_era():
         return
     
     session = session_data['session']
-    messages = session.continue_to_next_era()
+    messages = session.iter_continue_to_next_era()
     for msg in messages:
         emit('message', msg)
 
@@ -208,7 +210,7 @@ def handle_continue_to_score():
         return
     
     session = session_data['session']
-    messages = session.continue_to_score()
+    messages = session.iter_continue_to_score()
     for msg in messages:
         emit('message', msg)
 
@@ -312,7 +314,8 @@ def handle_restart():
         return
     
     user_id = session_data['user_id']
-    logger.info(f"Restart requested for {sid}")
+    logger.info("Restart requested for %s", sid)
+    session_data['session'].flush()
     
     # Create new session with same user_id
     session = GameSession(user_id=user_id)
@@ -328,6 +331,6 @@ def handle_restart():
 
 if __name__ == '__main__':
     port = int(os.environ.get('GAME_SERVER_PORT', 5001))
-    logger.info(f"Starting Anachron game server on port {port}")
+    logger.info("Starting Anachron game server on port %s", port)
     
     socketio.run(app, host='0.0.0.0', port=port, debug=False, allow_unsafe_werkzeug=True)